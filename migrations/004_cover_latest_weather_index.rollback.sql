@@ -0,0 +1,8 @@
+--
+-- Rollback: Restore the uncovered "latest" index
+--
+
+DROP INDEX IF EXISTS idx_weather_data_latest;
+
+CREATE INDEX IF NOT EXISTS idx_weather_data_latest
+    ON weather_data(location_id, data_granularity, timestamp DESC);
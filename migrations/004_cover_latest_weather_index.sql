@@ -0,0 +1,14 @@
+--
+-- Migration: Cover the "latest" index with the summary columns
+-- Description: Rebuilds idx_weather_data_latest with INCLUDE columns so the
+--              latest-reading and time-series queries can be index-only scans
+--
+
+DROP INDEX IF EXISTS idx_weather_data_latest;
+
+-- Query pattern: SELECT temperature, wind_speed, humidity ...
+--                WHERE location_id = X AND data_granularity = Y
+--                ORDER BY timestamp DESC
+CREATE INDEX IF NOT EXISTS idx_weather_data_latest
+    ON weather_data(location_id, data_granularity, timestamp DESC)
+    INCLUDE (temperature, wind_speed, humidity);
@@ -0,0 +1,19 @@
+--
+-- Rollback: Restore the original DECIMAL/INTEGER weather value columns
+--
+
+ALTER TABLE weather_data
+    ALTER COLUMN temperature TYPE DECIMAL(6, 2),
+    ALTER COLUMN temperature_apparent TYPE DECIMAL(6, 2),
+    ALTER COLUMN wind_speed TYPE DECIMAL(6, 2),
+    ALTER COLUMN wind_gust TYPE DECIMAL(6, 2),
+    ALTER COLUMN wind_direction TYPE INTEGER,
+    ALTER COLUMN humidity TYPE DECIMAL(5, 2),
+    ALTER COLUMN precipitation_probability TYPE DECIMAL(5, 2),
+    ALTER COLUMN weather_code TYPE INTEGER,
+    ALTER COLUMN cloud_cover TYPE DECIMAL(5, 2),
+    ALTER COLUMN visibility TYPE DECIMAL(8, 2),
+    ALTER COLUMN pressure_sea_level TYPE DECIMAL(8, 2),
+    ALTER COLUMN pressure_surface_level TYPE DECIMAL(8, 2),
+    ALTER COLUMN dew_point TYPE DECIMAL(6, 2),
+    ALTER COLUMN uv_index TYPE INTEGER;
@@ -0,0 +1,23 @@
+--
+-- Migration: Narrow weather value columns
+-- Description: Stores measurements as REAL (4 bytes) and small integer codes
+--              as SMALLINT (2 bytes) instead of variable-width DECIMAL and
+--              INTEGER. float4 keeps ~7 significant digits, well beyond the
+--              0.01 resolution the API reports.
+--
+
+ALTER TABLE weather_data
+    ALTER COLUMN temperature TYPE REAL,
+    ALTER COLUMN temperature_apparent TYPE REAL,
+    ALTER COLUMN wind_speed TYPE REAL,
+    ALTER COLUMN wind_gust TYPE REAL,
+    ALTER COLUMN wind_direction TYPE SMALLINT,   -- Degrees (0-360)
+    ALTER COLUMN humidity TYPE REAL,
+    ALTER COLUMN precipitation_probability TYPE REAL,
+    ALTER COLUMN weather_code TYPE SMALLINT,     -- Tomorrow.io codes fit in int2
+    ALTER COLUMN cloud_cover TYPE REAL,
+    ALTER COLUMN visibility TYPE REAL,
+    ALTER COLUMN pressure_sea_level TYPE REAL,
+    ALTER COLUMN pressure_surface_level TYPE REAL,
+    ALTER COLUMN dew_point TYPE REAL,
+    ALTER COLUMN uv_index TYPE SMALLINT;         -- 0-11+
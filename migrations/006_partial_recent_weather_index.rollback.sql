@@ -0,0 +1,5 @@
+--
+-- Rollback: Drop the partial recent-data index
+--
+
+DROP INDEX IF EXISTS idx_weather_data_recent;
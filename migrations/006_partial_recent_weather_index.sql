@@ -0,0 +1,18 @@
+--
+-- Migration: Partial index over recent weather data
+-- Description: Indexes only readings at or after a fixed cutoff, so the
+--              time-series lookups (a day ago to 5 days ahead) use a much
+--              smaller index than idx_weather_data_latest.
+--
+-- The cutoff must stay in sync with RECENT_DATA_CUTOFF in tomorrow/db.py:
+-- PostgreSQL only uses a partial index when the query repeats its predicate
+-- as a literal. Move it forward with a new migration that recreates this
+-- index and updates the constant (see "Moving the Recent-Data Cutoff" in
+-- migrations/README.md).
+--
+
+-- Query pattern: SELECT ... WHERE location_id = X AND data_granularity = Y
+--                  AND timestamp BETWEEN ... AND timestamp >= '2026-10-01'
+CREATE INDEX IF NOT EXISTS idx_weather_data_recent
+    ON weather_data(location_id, data_granularity, timestamp DESC)
+    WHERE timestamp >= '2026-10-01 00:00:00+00';
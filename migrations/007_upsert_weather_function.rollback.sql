@@ -0,0 +1,6 @@
+--
+-- Rollback: Drop the server-side weather upsert
+--
+
+DROP FUNCTION IF EXISTS upsert_weather(weather_reading_row[]);
+DROP TYPE IF EXISTS weather_reading_row;
@@ -0,0 +1,71 @@
+--
+-- Migration: Server-side weather upsert
+-- Description: Adds a composite row type and an upsert function that takes a
+--              whole batch as one array argument. The INSERT ... ON CONFLICT
+--              inside the function is planned once per session and reused.
+--
+
+-- Field order must match READING_COLUMNS in tomorrow/db.py
+CREATE TYPE weather_reading_row AS (
+    location_id INTEGER,
+    timestamp TIMESTAMPTZ,
+    temperature REAL,
+    temperature_apparent REAL,
+    wind_speed REAL,
+    wind_gust REAL,
+    wind_direction SMALLINT,
+    humidity REAL,
+    precipitation_probability REAL,
+    weather_code SMALLINT,
+    cloud_cover REAL,
+    visibility REAL,
+    pressure_sea_level REAL,
+    pressure_surface_level REAL,
+    dew_point REAL,
+    uv_index SMALLINT,
+    data_granularity VARCHAR(10)
+);
+
+-- A function rather than a procedure so the caller gets the row count back
+CREATE OR REPLACE FUNCTION upsert_weather(readings weather_reading_row[])
+RETURNS INTEGER
+LANGUAGE plpgsql
+AS $$
+DECLARE
+    affected INTEGER;
+BEGIN
+    INSERT INTO weather_data (
+        location_id, timestamp, temperature, temperature_apparent,
+        wind_speed, wind_gust, wind_direction, humidity,
+        precipitation_probability, weather_code, cloud_cover,
+        visibility, pressure_sea_level, pressure_surface_level,
+        dew_point, uv_index, data_granularity
+    )
+    SELECT
+        r.location_id, r.timestamp, r.temperature, r.temperature_apparent,
+        r.wind_speed, r.wind_gust, r.wind_direction, r.humidity,
+        r.precipitation_probability, r.weather_code, r.cloud_cover,
+        r.visibility, r.pressure_sea_level, r.pressure_surface_level,
+        r.dew_point, r.uv_index, r.data_granularity
+    FROM unnest(readings) AS r
+    ON CONFLICT (location_id, timestamp, data_granularity) DO UPDATE SET
+        temperature = EXCLUDED.temperature,
+        temperature_apparent = EXCLUDED.temperature_apparent,
+        wind_speed = EXCLUDED.wind_speed,
+        wind_gust = EXCLUDED.wind_gust,
+        wind_direction = EXCLUDED.wind_direction,
+        humidity = EXCLUDED.humidity,
+        precipitation_probability = EXCLUDED.precipitation_probability,
+        weather_code = EXCLUDED.weather_code,
+        cloud_cover = EXCLUDED.cloud_cover,
+        visibility = EXCLUDED.visibility,
+        pressure_sea_level = EXCLUDED.pressure_sea_level,
+        pressure_surface_level = EXCLUDED.pressure_surface_level,
+        dew_point = EXCLUDED.dew_point,
+        uv_index = EXCLUDED.uv_index,
+        fetched_at = NOW();
+
+    GET DIAGNOSTICS affected = ROW_COUNT;
+    RETURN affected;
+END
+$$;
@@ -0,0 +1,5 @@
+--
+-- Rollback: Drop the BRIN timestamp index
+--
+
+DROP INDEX IF EXISTS idx_weather_data_timestamp_brin;
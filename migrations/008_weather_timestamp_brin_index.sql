@@ -0,0 +1,13 @@
+--
+-- Migration: BRIN index on weather_data.timestamp
+-- Description: Readings arrive roughly in time order, so a block-range
+--              index prunes time-range scans that are not restricted to one
+--              location (reports, retention deletes) at a few KB of size
+--              and almost no insert cost. Point lookups keep using the
+--              per-location B-tree indexes.
+--
+
+-- Query pattern: SELECT ... WHERE timestamp BETWEEN ... AND ...
+CREATE INDEX IF NOT EXISTS idx_weather_data_timestamp_brin
+    ON weather_data USING BRIN (timestamp)
+    WITH (pages_per_range = 32);
@@ -10,36 +10,266 @@ Checks for:
 
 Usage:
     python scripts/audit.py
+    python scripts/audit.py --jobs 1   # parse files serially
 """
 
+import argparse
 import ast
+import functools
+import hashlib
+import multiprocessing
 import os
+import pickle
+import shutil
+import subprocess
 import sys
+import threading
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Set, Tuple
+from typing import Any, Callable, Dict, Iterator, List, Optional, Set, Tuple, TypeVar
 
-# Colors for terminal output
-GREEN = "\033[92m"
-RED = "\033[91m"
-YELLOW = "\033[93m"
-RESET = "\033[0m"
+# Colors for terminal output, dropped when stdout is a pipe or CI log
+_USE_COLOR = sys.stdout.isatty()
+GREEN = "\033[92m" if _USE_COLOR else ""
+RED = "\033[91m" if _USE_COLOR else ""
+YELLOW = "\033[93m" if _USE_COLOR else ""
+RESET = "\033[0m" if _USE_COLOR else ""
+
+# Status markers, built once rather than formatted on every line
+_PREFIX = {
+    "ok": f"{GREEN}✓{RESET} ",
+    "error": f"{RED}✗{RESET} ",
+    "warning": f"{YELLOW}!{RESET} ",
+    "info": "  ",
+}
+
+# External tools, resolved once instead of via a shell PATH lookup per call
+RUFF = shutil.which("ruff")
+DOCKER = shutil.which("docker")
+
+# Below this many files, parsing serially beats starting worker processes
+PARALLEL_MIN_FILES = 16
+
+T = TypeVar("T")
+
+# Per-file import results keyed by (path, mtime_ns, size), so a watcher that
+# imports this module and re-runs the check skips unchanged files entirely
+_imports_memo: Dict[Tuple[str, int, int], Tuple[List[str], Optional[str]]] = {}
+
+# Parsed ASTs are pickled here, keyed by interpreter version and file content
+AST_CACHE_DIR = Path(".audit_cache")
+
+
+# Per-thread output buffer so checks running in parallel don't interleave
+_output = threading.local()
+
+
+def _write(text: str) -> None:
+    """Write a line to the current check's buffer, or straight to stdout."""
+    lines = getattr(_output, "lines", None)
+    if lines is None:
+        sys.stdout.write(text + "\n")
+    else:
+        lines.append(text + "\n")
+
+
+def _buffered(check: Callable[..., T], *args: Any) -> Tuple[T, List[str]]:
+    """Run a check while capturing everything it writes."""
+    lines = _output.lines = []
+    try:
+        result = check(*args)
+    finally:
+        _output.lines = None
+    return result, lines
+
+
+def _run_quiet(cmd: List[Optional[str]]) -> int:
+    """Run a command without a shell, discarding output; return its exit code."""
+    if cmd[0] is None:
+        return 127  # Same status a shell reports for a missing command
+    return subprocess.run(
+        cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=False
+    ).returncode
 
 
 def print_status(message: str, status: str = "info"):
     """Print status message with color."""
-    if status == "ok":
-        print(f"{GREEN}✓{RESET} {message}")
-    elif status == "error":
-        print(f"{RED}✗{RESET} {message}")
-    elif status == "warning":
-        print(f"{YELLOW}!{RESET} {message}")
-    else:
-        print(f"  {message}")
+    _write(_PREFIX.get(status, _PREFIX["info"]) + message)
+
+
+def clear_audit_cache() -> None:
+    """Forget memoized per-file results (the on-disk AST cache is kept)."""
+    _imports_memo.clear()
+    _source.cache_clear()
+    _parse_ast.cache_clear()
+
+
+def _iter_py(dirpath: str, prefix: str = "") -> Iterator[Tuple[str, str]]:
+    """Yield (name, path) for the .py files directly inside dirpath.
+
+    Uses os.scandir so entries come straight from the directory listing
+    without building Path objects or issuing an extra stat per file.
+    """
+    with os.scandir(dirpath) as it:
+        for entry in it:
+            name = entry.name
+            if (
+                name.endswith(".py")
+                and name.startswith(prefix)
+                and name != "__init__.py"
+                and entry.is_file()
+            ):
+                yield name, entry.path
+
+
+def _read_bytes(path: str) -> bytes:
+    """Read a file as raw bytes (ast.parse accepts bytes, so skip decoding).
+
+    Unbuffered FileIO.read() sizes its buffer from fstat, so a small file is
+    a single read() with no TextIOWrapper or BufferedReader in between.
+    """
+    with open(path, "rb", buffering=0) as f:
+        return f.read()
+
+
+def _parsed(py_file: str, data: bytes) -> ast.Module:
+    """Parse a Python file, reusing a cached AST when the content is unchanged."""
+    digest = hashlib.sha256(data).hexdigest()
+    version = f"py{sys.version_info.major}{sys.version_info.minor}"
+    cache_path = AST_CACHE_DIR / f"{version}-{digest}.pkl"
+
+    try:
+        return pickle.loads(_read_bytes(str(cache_path)))
+    except Exception:
+        pass  # Missing, corrupt or incompatible entry - fall through and re-parse
+
+    # Equivalent to ast.parse() without the wrapper's keyword handling; no
+    # type comments and no inherited __future__ flags from this script
+    tree = compile(data, py_file, "exec", flags=ast.PyCF_ONLY_AST, dont_inherit=True)
+
+    try:
+        AST_CACHE_DIR.mkdir(exist_ok=True)
+        with open(cache_path, "wb", buffering=0) as f:
+            f.write(pickle.dumps(tree, protocol=pickle.HIGHEST_PROTOCOL))
+    except OSError:
+        pass  # Cache is best-effort; a read-only checkout still audits fine
+
+    return tree
+
+
+@functools.lru_cache(maxsize=256)
+def _source(path: str, mtime_ns: int) -> bytes:
+    """Read a file once per invocation; see _parse_ast for the key."""
+    return _read_bytes(path)
+
+
+@functools.lru_cache(maxsize=256)
+def _parse_ast(path: str, mtime_ns: int) -> ast.Module:
+    """Parse a file once per invocation, shared by every audit pass.
+
+    mtime_ns is part of the cache key so a file edited between calls (e.g.
+    under a watcher) is re-read instead of returning a stale tree. Callers
+    must not mutate the returned tree.
+    """
+    return _parsed(path, _source(path, mtime_ns))
+
+
+def _module_level(body: List[ast.stmt]) -> Iterator[ast.stmt]:
+    """Yield module-level statements, looking inside if/try blocks.
+
+    Imports live at module scope (possibly under ``if TYPE_CHECKING:`` or a
+    ``try``/``except ImportError``), so there is no need to walk every
+    expression in the tree.
+    """
+    for node in body:
+        yield node
+        if isinstance(node, ast.If):
+            yield from _module_level(node.body + node.orelse)
+        elif isinstance(node, ast.Try):
+            handlers = [stmt for handler in node.handlers for stmt in handler.body]
+            yield from _module_level(
+                node.body + handlers + node.orelse + node.finalbody
+            )
+
+
+def _extract_imports(py_file: str) -> Tuple[List[str], Optional[str]]:
+    """Return the tomorrow.* modules a file imports (process pool worker).
+
+    Errors are returned rather than raised so one bad file does not abort
+    the whole executor.map() iteration.
+    """
+    try:
+        mtime_ns = os.stat(py_file).st_mtime_ns
+        # Cheap substring check - no mention of the package means no edges
+        if b"tomorrow." not in _source(py_file, mtime_ns):
+            return [], None
+
+        tree = _parse_ast(py_file, mtime_ns)
+        modules = [
+            node.module
+            for node in _module_level(tree.body)
+            if isinstance(node, ast.ImportFrom)
+            and node.module
+            and node.module.startswith("tomorrow.")
+        ]
+        return modules, None
+    except Exception as e:
+        return [], str(e)
+
+
+def _count_tests_in(test_file: str) -> Tuple[int, Optional[str]]:
+    """Count test_* functions defined in a file (process pool worker)."""
+    try:
+        mtime_ns = os.stat(test_file).st_mtime_ns
+        # Only parse files that can possibly define a test function
+        if b"def test_" not in _source(test_file, mtime_ns):
+            return 0, None
+
+        tree = _parse_ast(test_file, mtime_ns)
+        # pytest collects module-level test functions and methods of test classes
+        count = 0
+        for node in tree.body:
+            members = node.body if isinstance(node, ast.ClassDef) else [node]
+            count += sum(
+                1
+                for member in members
+                if isinstance(member, (ast.FunctionDef, ast.AsyncFunctionDef))
+                and member.name.startswith("test_")
+            )
+        return count, None
+    except Exception as e:
+        return 0, str(e)
+
+
+def _pool_context() -> multiprocessing.context.BaseContext:
+    """Multiprocessing context for parse workers.
+
+    forkserver where the platform has it; Windows only offers spawn, which
+    is equally safe to start from a multi-threaded process.
+    """
+    if "forkserver" in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context("forkserver")
+    return multiprocessing.get_context("spawn")
+
+
+def _map_files(
+    func: Callable[[str], T],
+    paths: List[str],
+    executor: Optional[Executor] = None,
+) -> List[T]:
+    """Apply func to every path, fanning out to the executor when worthwhile.
+
+    Small batches run serially - spinning up worker processes costs more
+    than parsing a handful of files.
+    """
+    if executor is None or len(paths) < PARALLEL_MIN_FILES:
+        return [func(path) for path in paths]
+    return list(executor.map(func, paths, chunksize=8))
 
 
 def check_required_files() -> bool:
     """Check that all required files exist."""
-    print("\n=== Checking Required Files ===")
+    _write("\n=== Checking Required Files ===")
 
     required_files = [
         "tomorrow/__init__.py",
@@ -75,10 +305,22 @@ def check_required_files() -> bool:
         ".pre-commit-config.yaml",
     ]
 
+    # One directory listing per parent instead of one stat per file
+    listings: dict[str, Set[str]] = {}
+    for file in required_files:
+        directory = os.path.dirname(file) or "."
+        if directory not in listings:
+            try:
+                with os.scandir(directory) as it:
+                    listings[directory] = {entry.name for entry in it}
+            except OSError:
+                # Missing directory - every file under it is missing too
+                listings[directory] = set()
+
     all_exist = True
     for file in required_files:
-        path = Path(file)
-        if path.exists():
+        directory, name = os.path.split(file)
+        if name in listings[directory or "."]:
             print_status(f"{file}", "ok")
         else:
             print_status(f"{file} - MISSING", "error")
@@ -87,83 +329,104 @@ def check_required_files() -> bool:
     return all_exist
 
 
-def check_no_import_cycles() -> bool:
-    """Check for import cycles in tomorrow package."""
-    print("\n=== Checking Import Cycles ===")
-
-    # Build import graph
-    imports: dict[str, Set[str]] = {}
-
-    for py_file in Path("tomorrow").glob("*.py"):
-        if py_file.name == "__init__.py":
-            continue
-
-        module_name = f"tomorrow.{py_file.stem}"
-        imports[module_name] = set()
+def _find_cycle(adjacency: List[List[int]]) -> Optional[List[int]]:
+    """Return the first cycle in a graph of integer ids, or None.
 
-        try:
-            with open(py_file) as f:
-                tree = ast.parse(f.read())
+    Iterative three-colour DFS shared across roots, stopping at the first
+    back edge - one reported cycle is enough to fail the check, and the
+    whole search stays O(V + E).
+    """
+    # 0 = unvisited, 1 = on the current path, 2 = fully explored
+    color = [0] * len(adjacency)
 
-            for node in ast.walk(tree):
-                if isinstance(node, ast.ImportFrom):
-                    if node.module and node.module.startswith("tomorrow."):
-                        imports[module_name].add(node.module)
-        except Exception as e:
-            print_status(f"Error parsing {py_file}: {e}", "error")
+    for root in range(len(adjacency)):
+        if color[root] != 0:
             continue
 
-    # Check for cycles using DFS
-    def has_cycle(node: str, visited: Set[str], path: Set[str]) -> bool:
-        if node in path:
-            return True
-        if node in visited:
-            return False
+        color[root] = 1
+        stack = [(root, iter(adjacency[root]))]
+
+        while stack:
+            node, neighbors = stack[-1]
+            for neighbor in neighbors:
+                state = color[neighbor]
+                if state == 1:
+                    # Back edge - the cycle is the stack suffix starting at neighbor
+                    path = [i for i, _ in stack]
+                    return path[path.index(neighbor) :] + [neighbor]
+                if state == 0:
+                    color[neighbor] = 1
+                    stack.append((neighbor, iter(adjacency[neighbor])))
+                    break
+            else:
+                color[node] = 2
+                stack.pop()
+
+    return None
+
+
+def check_no_import_cycles(executor: Optional[Executor] = None) -> bool:
+    """Check for import cycles in tomorrow package."""
+    _write("\n=== Checking Import Cycles ===")
 
-        visited.add(node)
-        path.add(node)
+    # Build import graph
+    imports: dict[str, Set[str]] = {}
 
-        for neighbor in imports.get(node, set()):
-            if has_cycle(neighbor, visited, path):
-                return True
+    py_files = list(_iter_py("tomorrow"))
+
+    # Only parse files whose (path, mtime, size) isn't already memoized
+    keys = []
+    for _, py_file in py_files:
+        stat = os.stat(py_file)
+        keys.append((py_file, stat.st_mtime_ns, stat.st_size))
+    misses = [key for key in keys if key not in _imports_memo]
+    results = _map_files(_extract_imports, [key[0] for key in misses], executor)
+    _imports_memo.update(zip(misses, results))
+
+    for (name, py_file), key in zip(py_files, keys):
+        modules, error = _imports_memo[key]
+        module_name = f"tomorrow.{name[:-3]}"
+        imports[module_name] = set(modules)
+        if error:
+            print_status(f"Error parsing {py_file}: {error}", "error")
+
+    # Give each module a small integer id and build adjacency lists over ids,
+    # dropping edges to modules outside the graph (they cannot close a cycle)
+    modules = sorted(imports)
+    index = {module: i for i, module in enumerate(modules)}
+    adjacency = [
+        sorted(index[dep] for dep in imports[module] if dep in index)
+        for module in modules
+    ]
 
-        path.remove(node)
+    cycle = _find_cycle(adjacency)
+    if cycle:
+        print_status(
+            "Import cycle detected: " + " -> ".join(modules[i] for i in cycle),
+            "error",
+        )
         return False
 
-    no_cycles = True
-    for module in imports:
-        if has_cycle(module, set(), set()):
-            print_status(f"Import cycle detected involving {module}", "error")
-            no_cycles = False
+    print_status("No import cycles detected", "ok")
+    return True
 
-    if no_cycles:
-        print_status("No import cycles detected", "ok")
 
-    return no_cycles
-
-
-def count_tests() -> Tuple[int, int]:
+def count_tests(executor: Optional[Executor] = None) -> Tuple[int, int]:
     """Count total tests and check coverage."""
-    print("\n=== Test Count ===")
+    _write("\n=== Test Count ===")
 
-    test_files = list(Path("tests").glob("test_*.py"))
+    test_files = list(_iter_py("tests", prefix="test_"))
     total_tests = 0
 
-    for test_file in test_files:
-        try:
-            with open(test_file) as f:
-                tree = ast.parse(f.read())
+    results = _map_files(_count_tests_in, [path for _, path in test_files], executor)
 
-            test_count = 0
-            for node in ast.walk(tree):
-                if isinstance(node, ast.FunctionDef):
-                    if node.name.startswith("test_"):
-                        test_count += 1
+    for (name, test_file), (test_count, error) in zip(test_files, results):
+        if error:
+            print_status(f"Error parsing {test_file}: {error}", "warning")
+            continue
 
-            total_tests += test_count
-            print_status(f"{test_file.name}: {test_count} tests", "ok")
-        except Exception as e:
-            print_status(f"Error parsing {test_file}: {e}", "warning")
+        total_tests += test_count
+        print_status(f"{name}: {test_count} tests", "ok")
 
     print_status(f"Total: {total_tests} tests", "ok")
     return total_tests, len(test_files)
@@ -171,9 +434,9 @@ def count_tests() -> Tuple[int, int]:
 
 def check_code_quality() -> bool:
     """Check code quality with ruff."""
-    print("\n=== Code Quality (Ruff) ===")
+    _write("\n=== Code Quality (Ruff) ===")
 
-    result = os.system("ruff check tomorrow/ --ignore E501 > /dev/null 2>&1")
+    result = _run_quiet([RUFF, "check", "tomorrow/", "--ignore", "E501"])
 
     if result == 0:
         print_status("No linting errors", "ok")
@@ -187,9 +450,9 @@ def check_code_quality() -> bool:
 
 def check_formatting() -> bool:
     """Check code formatting with ruff."""
-    print("\n=== Code Formatting (Ruff) ===")
+    _write("\n=== Code Formatting (Ruff) ===")
 
-    result = os.system("ruff format tomorrow/ --check > /dev/null 2>&1")
+    result = _run_quiet([RUFF, "format", "tomorrow/", "--check"])
 
     if result == 0:
         print_status("Code is properly formatted", "ok")
@@ -201,9 +464,9 @@ def check_formatting() -> bool:
 
 def check_docker_compose() -> bool:
     """Validate docker-compose.yaml."""
-    print("\n=== Docker Compose Validation ===")
+    _write("\n=== Docker Compose Validation ===")
 
-    result = os.system("docker compose config > /dev/null 2>&1")
+    result = _run_quiet([DOCKER, "compose", "config"])
 
     if result == 0:
         print_status("docker-compose.yaml is valid", "ok")
@@ -215,7 +478,7 @@ def check_docker_compose() -> bool:
 
 def check_environment_variables() -> bool:
     """Check environment variable documentation."""
-    print("\n=== Environment Variables ===")
+    _write("\n=== Environment Variables ===")
 
     required_vars = [
         "TOMORROW_API_KEY",
@@ -227,17 +490,22 @@ def check_environment_variables() -> bool:
         "LOG_LEVEL",
     ]
 
-    # Check .env.example
-    if not Path(".env.example").exists():
+    # Collect declared names in one pass; comments don't count as documented
+    try:
+        env_content = _read_bytes(".env.example")
+    except FileNotFoundError:
         print_status(".env.example not found", "error")
         return False
 
-    with open(".env.example") as f:
-        env_content = f.read()
+    declared = {
+        line.split(b"=", 1)[0].strip().decode()
+        for line in env_content.splitlines()
+        if b"=" in line and not line.lstrip().startswith(b"#")
+    }
 
     all_documented = True
     for var in required_vars:
-        if var in env_content:
+        if var in declared:
             print_status(f"{var} documented", "ok")
         else:
             print_status(f"{var} not in .env.example", "warning")
@@ -286,17 +554,64 @@ def generate_summary(
 
 def main():
     """Run complete audit."""
+    parser = argparse.ArgumentParser(description="Codebase audit")
+    parser.add_argument(
+        "--jobs",
+        "-j",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Worker processes for parsing source files (1 = serial)",
+    )
+    args = parser.parse_args()
+
     print("=" * 50)
     print("Tomorrow.io Weather Pipeline - Codebase Audit")
     print("=" * 50)
 
-    files_ok = check_required_files()
-    cycles_ok = check_no_import_cycles()
-    total_tests, _ = count_tests()
-    quality_ok = check_code_quality()
-    format_ok = check_formatting()
-    docker_ok = check_docker_compose()
-    env_ok = check_environment_variables()
+    # One pool shared by both parsing passes; workers start on first submit.
+    # That submit happens inside a check thread while the other checks may
+    # hold locks, so workers come from a forkserver (or spawn) rather than
+    # fork() of this multi-threaded process, which can deadlock
+    executor = (
+        ProcessPoolExecutor(max_workers=args.jobs, mp_context=_pool_context())
+        if args.jobs > 1
+        else None
+    )
+
+    # The checks are independent and mostly wait on I/O or child processes,
+    # so run them concurrently and replay their output in report order
+    checks = [
+        (check_required_files,),
+        (check_no_import_cycles, executor),
+        (count_tests, executor),
+        (check_code_quality,),
+        (check_formatting,),
+        (check_docker_compose,),
+        (check_environment_variables,),
+    ]
+    results = []
+    try:
+        with ThreadPoolExecutor(max_workers=len(checks)) as pool:
+            futures = [pool.submit(_buffered, *check) for check in checks]
+            for future in futures:
+                result, lines = future.result()
+                # One write per section rather than one per status line
+                sys.stdout.write("".join(lines))
+                sys.stdout.flush()
+                results.append(result)
+    finally:
+        if executor is not None:
+            executor.shutdown()
+
+    (
+        files_ok,
+        cycles_ok,
+        (total_tests, _),
+        quality_ok,
+        format_ok,
+        docker_ok,
+        env_ok,
+    ) = results
 
     all_ok = generate_summary(
         files_ok,
@@ -0,0 +1,164 @@
+"""Shared pytest fixtures."""
+
+import os
+import warnings
+from types import MappingProxyType
+
+import psycopg2
+import pytest
+from psycopg2 import sql
+
+from tomorrow.config import Settings
+from tomorrow.models import TimelinesResponse
+
+# Required fields only - everything else should come from Field defaults
+SETTINGS_DEFAULTS = {"tomorrow_api_key": "test", "pg_password": "test"}
+
+# Under pytest-xdist each worker ("gw0", "gw1", ...) gets its own database so
+# tests can run in parallel; a plain run keeps using the default database
+XDIST_WORKER = os.environ.get("PYTEST_XDIST_WORKER")
+TEST_DATABASE = f"tomorrow_test_{XDIST_WORKER}" if XDIST_WORKER else "tomorrow"
+
+if XDIST_WORKER:
+    # Set before any test module reads PGDATABASE
+    os.environ["PGDATABASE"] = TEST_DATABASE
+
+
+def _freeze(value):
+    """Recursively turn dicts into read-only mappings and lists into tuples."""
+    if isinstance(value, dict):
+        return MappingProxyType({k: _freeze(v) for k, v in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+# Sample Tomorrow.io timelines response, frozen so a test cannot change
+# what every later test in the session sees
+API_RESPONSE_JSON = _freeze(
+    {
+        "data": {
+            "timelines": [
+                {
+                    "timestep": "1m",
+                    "startTime": "2024-01-01T12:00:00Z",
+                    "endTime": "2024-01-01T13:00:00Z",
+                    "intervals": [
+                        {
+                            "startTime": "2024-01-01T12:00:00Z",
+                            "values": {
+                                "temperature": 25.5,
+                                "windSpeed": 5.2,
+                                "humidity": 65.0,
+                                "weatherCode": 1000,
+                            },
+                        }
+                    ],
+                },
+                {
+                    "timestep": "1h",
+                    "startTime": "2024-01-01T12:00:00Z",
+                    "endTime": "2024-01-01T13:00:00Z",
+                    "intervals": [],
+                },
+            ]
+        }
+    }
+)
+
+
+@pytest.fixture(scope="session", autouse=True)
+def worker_database():
+    """Create and migrate this xdist worker's database once per session."""
+    if XDIST_WORKER:
+        try:
+            conn = psycopg2.connect(
+                host=os.getenv("PGHOST", "localhost"),
+                port=os.getenv("PGPORT", "5432"),
+                database="postgres",
+                user=os.getenv("PGUSER", "postgres"),
+                password=os.getenv("PGPASSWORD", "postgres"),
+            )
+        except psycopg2.OperationalError as e:
+            # Leave DB tests to fail on their own; the rest still run
+            warnings.warn(f"Could not create {TEST_DATABASE}: {e}")
+        else:
+            # CREATE DATABASE cannot run inside a transaction
+            conn.autocommit = True
+            try:
+                with conn.cursor() as cur:
+                    cur.execute(
+                        "SELECT 1 FROM pg_database WHERE datname = %s",
+                        (TEST_DATABASE,),
+                    )
+                    if cur.fetchone() is None:
+                        cur.execute(
+                            sql.SQL("CREATE DATABASE {} TEMPLATE template0").format(
+                                sql.Identifier(TEST_DATABASE)
+                            )
+                        )
+            finally:
+                conn.close()
+
+            from tomorrow.migrations import run_migrations
+
+            run_migrations()
+    yield
+
+
+@pytest.fixture(scope="session")
+def db_conn():
+    """Provide one database connection for the whole session.
+
+    Shared by the migration test modules: opening a connection (backend
+    start-up and authentication) costs more than any query they run. If
+    the database cannot be reached, every dependent test is skipped after
+    this one attempt. Tests must leave the connection out of a failed
+    transaction; their cursor fixtures roll back on teardown.
+    """
+    try:
+        conn = psycopg2.connect(
+            host=os.getenv("PGHOST", "localhost"),
+            port=os.getenv("PGPORT", "5432"),
+            database=os.getenv("PGDATABASE", "tomorrow"),
+            user=os.getenv("PGUSER", "postgres"),
+            password=os.getenv("PGPASSWORD", "postgres"),
+        )
+    except psycopg2.OperationalError as e:
+        pytest.skip(f"Database not available: {e}")
+    yield conn
+    conn.close()
+
+
+@pytest.fixture(scope="session")
+def api_response_json():
+    """The read-only sample API response (see API_RESPONSE_JSON)."""
+    return API_RESPONSE_JSON
+
+
+@pytest.fixture(scope="session")
+def parsed_timelines_response(api_response_json):
+    """api_response_json validated into a TimelinesResponse, once per session."""
+    return TimelinesResponse.model_validate(api_response_json)
+
+
+@pytest.fixture(scope="session")
+def first_minutely_interval(parsed_timelines_response):
+    """First interval of the minutely timeline in the parsed sample response."""
+    return parsed_timelines_response.data.timelines[0].intervals[0]
+
+
+@pytest.fixture
+def make_settings():
+    """Build Settings without running validators or reading the environment.
+
+    Only for tests that read attributes or properties; anything checking
+    validation or env loading must construct Settings(...) for real.
+    """
+
+    def _make(**overrides) -> Settings:
+        return Settings.model_construct(
+            _fields_set=set(overrides), **{**SETTINGS_DEFAULTS, **overrides}
+        )
+
+    return _make
@@ -3,10 +3,12 @@
 import json
 import os
 from datetime import datetime, timezone
-from unittest.mock import MagicMock, patch
+from types import SimpleNamespace
+from urllib.parse import parse_qs, urlparse
 
 import pytest
 import requests
+from requests.adapters import HTTPAdapter
 
 # Set required environment variables for tests
 os.environ.setdefault("TOMORROW_API_KEY", "test_api_key_for_tests")
@@ -17,44 +19,31 @@ from tomorrow.client import (
     TomorrowAPIError,
     TomorrowAPIRateLimitError,
     DEFAULT_FIELDS,
+    _response_cache,
+    clear_response_cache,
 )
 from tomorrow.models import Location, TimelinesResponse
 
 
-# =============================================================================
-# Fixtures
-# =============================================================================
-
-
-@pytest.fixture
-def api_key():
-    """Test API key."""
-    return "test_api_key_12345"
-
-
-@pytest.fixture
-def client(api_key):
-    """Create a test client."""
-    with TomorrowClient(api_key=api_key) as client:
-        yield client
-
-
-@pytest.fixture
-def sample_location():
-    """Create a sample location."""
-    return Location(
-        id=1,
-        lat=25.86,
-        lon=-97.42,
-        name="Test Location",
-        is_active=True,
-    )
+_EXPECTED_DEFAULT_FIELDS = frozenset(
+    {
+        "temperature",
+        "temperatureApparent",
+        "windSpeed",
+        "windGust",
+        "windDirection",
+        "humidity",
+        "precipitationProbability",
+        "weatherCode",
+        "pressureSeaLevel",
+        "pressureSurfaceLevel",
+    }
+)
 
 
-@pytest.fixture
-def mock_weather_response():
-    """Create a mock API response."""
-    return {
+# Canned API bodies, encoded once at import instead of per test
+WEATHER_RESPONSE_BODY = json.dumps(
+    {
         "data": {
             "timelines": [
                 {
@@ -111,24 +100,147 @@ def mock_weather_response():
             ]
         }
     }
+).encode()
+
+CUSTOM_FIELDS_RESPONSE_BODY = json.dumps(
+    {
+        "data": {
+            "timelines": [
+                {
+                    "timestep": "1h",
+                    "startTime": "2024-01-01T12:00:00Z",
+                    "endTime": "2024-01-01T13:00:00Z",
+                    "intervals": [
+                        {
+                            "startTime": "2024-01-01T12:00:00Z",
+                            "values": {
+                                "temperature": 22.5,
+                                "humidity": 65,
+                            },
+                        }
+                    ],
+                }
+            ]
+        }
+    }
+).encode()
 
+MINUTELY_RESPONSE_BODY = json.dumps(
+    {
+        "data": {
+            "timelines": [
+                {
+                    "timestep": "1m",
+                    "startTime": "2024-01-01T12:00:00Z",
+                    "endTime": "2024-01-01T12:01:00Z",
+                    "intervals": [],
+                }
+            ]
+        }
+    }
+).encode()
 
-def create_mock_response(status_code=200, json_data=None, text=""):
-    """Helper to create a mock requests response."""
-    mock_response = MagicMock()
-    mock_response.status_code = status_code
-    if json_data is not None:
-        mock_response.json.return_value = json_data
-    else:
-        mock_response.json.side_effect = json.JSONDecodeError("test", text, 0)
-    mock_response.text = text or json.dumps(json_data) if json_data else ""
-    
-    if status_code >= 400:
-        mock_response.raise_for_status.side_effect = requests.exceptions.HTTPError(
-            f"{status_code} Error", response=mock_response
-        )
-    
-    return mock_response
+EMPTY_RESPONSE_BODY = b'{"data": {"timelines": []}}'
+
+
+# =============================================================================
+# Fixtures
+# =============================================================================
+
+
+@pytest.fixture(scope="module")
+def api_key():
+    """Test API key."""
+    return "test_api_key_12345"
+
+
+@pytest.fixture
+def client(api_key):
+    """Create a test client."""
+    with TomorrowClient(api_key=api_key) as client:
+        yield client
+
+
+@pytest.fixture(scope="module")
+def sample_location():
+    """Create a sample location."""
+    return Location(
+        id=1,
+        lat=25.86,
+        lon=-97.42,
+        name="Test Location",
+        is_active=True,
+    )
+
+
+@pytest.fixture(scope="module")
+def mock_weather_response():
+    """Encoded body of a typical API response (built once at import)."""
+    return WEATHER_RESPONSE_BODY
+
+
+def create_mock_response(status_code=200, content=b""):
+    """Helper to create a real requests response with a canned body."""
+    response = requests.Response()
+    response.status_code = status_code
+    response._content = content
+    response.encoding = "utf-8"
+    return response
+
+
+class RoutingAdapter(HTTPAdapter):
+    """Transport adapter that answers requests from a routing table.
+
+    Mounted on the client's session in place of the network, so tests run
+    through the real requests code path (param encoding, raise_for_status,
+    body parsing) without patching Session.get.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.routes = {}
+        self.requests = []
+
+    def reset(self):
+        """Forget routes and recorded requests from a previous test."""
+        self.routes.clear()
+        self.requests.clear()
+
+    def route(self, endpoint, status=200, body=b"", exc=None):
+        """Answer requests to endpoint with an encoded body, or raise exc."""
+        self.routes[endpoint] = (status, body, exc)
+
+    def send(self, request, **kwargs):
+        self.requests.append(request)
+        status, body, exc = self.routes[urlparse(request.url).path.rsplit("/", 1)[-1]]
+        if exc is not None:
+            raise exc
+
+        response = create_mock_response(status, body)
+        response.url = request.url
+        response.request = request
+        return response
+
+    @property
+    def last_params(self):
+        """Query parameters of the most recent request."""
+        query = urlparse(self.requests[-1].url).query
+        return {key: values[0] for key, values in parse_qs(query).items()}
+
+
+@pytest.fixture(scope="module")
+def routing_adapter():
+    """One adapter for the module; building an HTTPAdapter sets up a pool."""
+    return RoutingAdapter()
+
+
+@pytest.fixture
+def transport(client, routing_adapter):
+    """Mount the routing adapter on the client session, with no routes."""
+    routing_adapter.reset()
+    clear_response_cache()
+    client.session.mount("https://", routing_adapter)
+    return routing_adapter
 
 
 # =============================================================================
@@ -173,13 +285,12 @@ class TestSuccessfulAPICalls:
     """Tests for successful API interactions."""
 
     def test_fetch_weather_success(
-        self, client, sample_location, mock_weather_response
+        self, client, transport, sample_location, mock_weather_response
     ):
         """Should successfully fetch and parse weather data."""
-        mock_response = create_mock_response(200, mock_weather_response)
+        transport.route("timelines", 200, mock_weather_response)
 
-        with patch.object(client.session, "get", return_value=mock_response):
-            response = client.fetch_weather(sample_location)
+        response = client.fetch_weather(sample_location)
 
         # Verify response is parsed correctly
         assert isinstance(response, TimelinesResponse)
@@ -196,83 +307,161 @@ class TestSuccessfulAPICalls:
         assert first_entry.values.temperature == 22.5
         assert first_entry.values.wind_speed == 5.2
 
-    def test_fetch_weather_with_custom_fields(self, client, sample_location):
+    def test_fetch_weather_with_custom_fields(self, client, transport, sample_location):
         """Should request only specified fields."""
-        mock_response = create_mock_response(
-            200,
-            {
-                "data": {
-                    "timelines": [
-                        {
-                            "timestep": "1h",
-                            "startTime": "2024-01-01T12:00:00Z",
-                            "endTime": "2024-01-01T13:00:00Z",
-                            "intervals": [
-                                {
-                                    "startTime": "2024-01-01T12:00:00Z",
-                                    "values": {
-                                        "temperature": 22.5,
-                                        "humidity": 65,
-                                    },
-                                }
-                            ]
-                        }
-                    ]
-                }
-            },
-        )
+        transport.route("timelines", 200, CUSTOM_FIELDS_RESPONSE_BODY)
 
         custom_fields = ["temperature", "humidity"]
 
-        with patch.object(
-            client.session, "get", return_value=mock_response
-        ) as mock_get:
-            response = client.fetch_weather(sample_location, fields=custom_fields)
+        client.fetch_weather(sample_location, fields=custom_fields)
 
-            # Verify request was made
-            mock_get.assert_called_once()
-            call_kwargs = mock_get.call_args[1]
-            assert "params" in call_kwargs
-            assert "temperature" in call_kwargs["params"]["fields"]
+        # Verify request was made
+        assert len(transport.requests) == 1
+        assert transport.last_params["fields"] == "temperature,humidity"
 
-    def test_fetch_weather_with_time_range(self, client, sample_location):
+    def test_fetch_weather_with_time_range(self, client, transport, sample_location):
         """Should support custom time range."""
-        mock_response = create_mock_response(200, {"data": {"timelines": []}})
-
-        with patch.object(
-            client.session, "get", return_value=mock_response
-        ) as mock_get:
-            client.fetch_weather(
-                sample_location,
-                start_time="2024-01-01T00:00:00Z",
-                end_time="2024-01-02T00:00:00Z",
-            )
-
-            # Verify time parameters in call
-            call_kwargs = mock_get.call_args[1]
-            assert "params" in call_kwargs
-            assert call_kwargs["params"]["startTime"] == "2024-01-01T00:00:00Z"
-            assert call_kwargs["params"]["endTime"] == "2024-01-02T00:00:00Z"
-
-    def test_fetch_weather_minutely_timesteps(self, client, sample_location):
+        transport.route("timelines", 200, EMPTY_RESPONSE_BODY)
+
+        client.fetch_weather(
+            sample_location,
+            start_time="2024-01-01T00:00:00Z",
+            end_time="2024-01-02T00:00:00Z",
+        )
+
+        # Verify time parameters in request
+        params = transport.last_params
+        assert params["startTime"] == "2024-01-01T00:00:00Z"
+        assert params["endTime"] == "2024-01-02T00:00:00Z"
+
+    def test_fetch_weather_minutely_timesteps(self, client, transport, sample_location):
         """Should support minutely timesteps."""
-        mock_response = create_mock_response(200, {
-            "data": {
-                "timelines": [
-                    {
-                        "timestep": "1m",
-                        "startTime": "2024-01-01T12:00:00Z",
-                        "endTime": "2024-01-01T12:01:00Z",
-                        "intervals": []
-                    }
-                ]
-            }
-        })
-
-        with patch.object(client.session, "get", return_value=mock_response):
-            response = client.fetch_weather(sample_location, timesteps="1m")
-            minutely = next((t for t in response.data.timelines if t.timestep == "1m"), None)
-            assert minutely is not None
+        transport.route("timelines", 200, MINUTELY_RESPONSE_BODY)
+
+        response = client.fetch_weather(sample_location, timesteps="1m")
+        minutely = next((t for t in response.data.timelines if t.timestep == "1m"), None)
+        assert minutely is not None
+
+
+# =============================================================================
+# Response Cache Tests
+# =============================================================================
+
+
+class TestResponseCache:
+    """Tests for the API response TTL cache."""
+
+    def test_repeat_request_in_same_hour_is_cached(
+        self, client, transport, sample_location
+    ):
+        """Should answer a repeat request within the same hour from the cache."""
+        transport.route("timelines", 200, WEATHER_RESPONSE_BODY)
+
+        first = client.fetch_weather(sample_location, start_time="2024-01-01T12:05:00Z")
+        second = client.fetch_weather(sample_location, start_time="2024-01-01T12:40:00Z")
+
+        assert second == first
+        assert len(transport.requests) == 1
+
+    def test_cached_response_is_a_copy(self, client, transport, sample_location):
+        """Should not let one caller's changes leak to the next cache hit."""
+        transport.route("timelines", 200, WEATHER_RESPONSE_BODY)
+
+        first = client.fetch_weather(sample_location)
+        first.data.timelines.clear()
+        second = client.fetch_weather(sample_location)
+
+        assert second is not first
+        assert len(second.data.timelines) > 0
+        assert len(transport.requests) == 1
+
+    def test_other_api_key_is_not_served_from_cache(
+        self, transport, routing_adapter, sample_location
+    ):
+        """Should not share cached responses between API keys."""
+        transport.route("timelines", 200, WEATHER_RESPONSE_BODY)
+
+        for api_key in ("key_one", "key_two"):
+            with TomorrowClient(api_key=api_key) as client:
+                client.session.mount("https://", routing_adapter)
+                client.fetch_weather(sample_location)
+
+        assert len(routing_adapter.requests) == 2
+
+    def test_expired_entry_is_dropped(
+        self, client, transport, sample_location, monkeypatch
+    ):
+        """Should remove an expired entry on lookup and request again."""
+        transport.route("timelines", 200, WEATHER_RESPONSE_BODY)
+        now = [1000.0]
+        monkeypatch.setattr(
+            "tomorrow.client.time", SimpleNamespace(monotonic=lambda: now[0])
+        )
+
+        client.fetch_weather(sample_location)
+        now[0] += client.cache_ttl
+
+        # A failed refetch stores nothing, so only the lookup can empty it
+        transport.route("timelines", 500, b"Internal Server Error")
+        with pytest.raises(TomorrowAPIError):
+            client.fetch_weather(sample_location)
+
+        assert len(transport.requests) == 2
+        assert len(_response_cache) == 0
+
+    def test_different_hour_is_not_cached(self, client, transport, sample_location):
+        """Should request again when the time range moves to another hour."""
+        transport.route("timelines", 200, WEATHER_RESPONSE_BODY)
+
+        client.fetch_weather(sample_location, start_time="2024-01-01T12:05:00Z")
+        client.fetch_weather(sample_location, start_time="2024-01-01T13:05:00Z")
+
+        assert len(transport.requests) == 2
+
+    def test_same_instant_with_other_offset_is_cached(
+        self, client, transport, sample_location
+    ):
+        """Should key the hour on the UTC instant, not the written offset."""
+        transport.route("timelines", 200, WEATHER_RESPONSE_BODY)
+
+        client.fetch_weather(sample_location, start_time="2024-01-01T12:05:00Z")
+        client.fetch_weather(sample_location, start_time="2024-01-01T14:05:00+02:00")
+
+        assert len(transport.requests) == 1
+
+    def test_same_local_hour_in_other_offset_is_not_cached(
+        self, client, transport, sample_location
+    ):
+        """Should request again when equal wall-clock hours are different instants."""
+        transport.route("timelines", 200, WEATHER_RESPONSE_BODY)
+
+        client.fetch_weather(sample_location, start_time="2024-01-01T12:05:00Z")
+        client.fetch_weather(sample_location, start_time="2024-01-01T12:05:00+02:00")
+
+        assert len(transport.requests) == 2
+
+    def test_errors_are_not_cached(self, client, transport, sample_location):
+        """Should not cache failed requests."""
+        transport.route("timelines", 500, b"Internal Server Error")
+        with pytest.raises(TomorrowAPIError):
+            client.fetch_weather(sample_location)
+
+        transport.route("timelines", 200, WEATHER_RESPONSE_BODY)
+        response = client.fetch_weather(sample_location)
+
+        assert isinstance(response, TimelinesResponse)
+
+    def test_cache_disabled(self, api_key, routing_adapter, sample_location):
+        """Should always request when cache_ttl is 0."""
+        routing_adapter.reset()
+        routing_adapter.route("timelines", 200, WEATHER_RESPONSE_BODY)
+
+        with TomorrowClient(api_key=api_key, cache_ttl=0) as client:
+            client.session.mount("https://", routing_adapter)
+            client.fetch_weather(sample_location)
+            client.fetch_weather(sample_location)
+
+        assert len(routing_adapter.requests) == 2
 
 
 # =============================================================================
@@ -283,69 +472,64 @@ class TestSuccessfulAPICalls:
 class TestErrorHandling:
     """Tests for API error handling."""
 
-    def test_auth_error_401(self, client, sample_location):
+    def test_auth_error_401(self, client, transport, sample_location):
         """Should raise generic TomorrowAPIError on 401."""
-        mock_response = create_mock_response(401, text="Unauthorized")
+        transport.route("timelines", 401, b"Unauthorized")
 
-        with patch.object(client.session, "get", return_value=mock_response):
-            with pytest.raises(TomorrowAPIError) as exc_info:
-                client.fetch_weather(sample_location)
+        with pytest.raises(TomorrowAPIError) as exc_info:
+            client.fetch_weather(sample_location)
 
         assert "401" in str(exc_info.value)
 
-    def test_rate_limit_error_429(self, client, sample_location):
+    def test_rate_limit_error_429(self, client, transport, sample_location):
         """Should raise TomorrowAPIRateLimitError on 429."""
-        mock_response = create_mock_response(429, text="Rate limit exceeded")
+        transport.route("timelines", 429, b"Rate limit exceeded")
 
-        with patch.object(client.session, "get", return_value=mock_response):
-            with pytest.raises(TomorrowAPIRateLimitError) as exc_info:
-                client.fetch_weather(sample_location)
+        with pytest.raises(TomorrowAPIRateLimitError) as exc_info:
+            client.fetch_weather(sample_location)
 
         assert "rate limit exceeded" in str(exc_info.value).lower()
 
-    def test_server_error_500(self, client, sample_location):
+    def test_server_error_500(self, client, transport, sample_location):
         """Should raise TomorrowAPIError on 500."""
-        mock_response = create_mock_response(500, text="Internal Server Error")
+        transport.route("timelines", 500, b"Internal Server Error")
 
-        with patch.object(client.session, "get", return_value=mock_response):
-            with pytest.raises(TomorrowAPIError) as exc_info:
-                client.fetch_weather(sample_location)
+        with pytest.raises(TomorrowAPIError) as exc_info:
+            client.fetch_weather(sample_location)
         
         assert "500" in str(exc_info.value)
 
-    def test_invalid_json_response(self, client, sample_location):
+    def test_invalid_json_response(self, client, transport, sample_location):
         """Should handle invalid JSON response."""
-        mock_response = create_mock_response(200, text="invalid json")
+        transport.route("timelines", 200, b"invalid json")
 
-        with patch.object(client.session, "get", return_value=mock_response):
-            with pytest.raises(TomorrowAPIError) as exc_info:
-                client.fetch_weather(sample_location)
+        with pytest.raises(TomorrowAPIError) as exc_info:
+            client.fetch_weather(sample_location)
 
         assert (
             "invalid response" in str(exc_info.value).lower()
         )
 
-    def test_timeout_error(self, client, sample_location):
+    def test_timeout_error(self, client, transport, sample_location):
         """Should handle request timeout."""
-        with patch.object(
-            client.session,
-            "get",
-            side_effect=requests.exceptions.Timeout("Request timed out"),
-        ):
-            with pytest.raises(TomorrowAPIError) as exc_info:
-                client.fetch_weather(sample_location)
+        transport.route(
+            "timelines", exc=requests.exceptions.Timeout("Request timed out")
+        )
+
+        with pytest.raises(TomorrowAPIError) as exc_info:
+            client.fetch_weather(sample_location)
 
         assert "request failed" in str(exc_info.value).lower() and "time" in str(exc_info.value).lower()
 
-    def test_connection_error(self, client, sample_location):
+    def test_connection_error(self, client, transport, sample_location):
         """Should handle connection error."""
-        with patch.object(
-            client.session,
-            "get",
-            side_effect=requests.exceptions.ConnectionError("Connection failed"),
-        ):
-            with pytest.raises(TomorrowAPIError) as exc_info:
-                client.fetch_weather(sample_location)
+        transport.route(
+            "timelines",
+            exc=requests.exceptions.ConnectionError("Connection failed"),
+        )
+
+        with pytest.raises(TomorrowAPIError) as exc_info:
+            client.fetch_weather(sample_location)
 
         assert "request failed" in str(exc_info.value).lower()
 
@@ -360,18 +544,6 @@ class TestDefaultFields:
 
     def test_default_fields_list(self):
         """Should have essential default fields (simplified)."""
-        expected_fields = [
-            "temperature",
-            "temperatureApparent",
-            "windSpeed",
-            "windGust",
-            "windDirection",
-            "humidity",
-            "precipitationProbability",
-            "weatherCode",
-            "pressureSeaLevel",
-            "pressureSurfaceLevel",
-        ]
-
-        assert DEFAULT_FIELDS == expected_fields
-        assert len(DEFAULT_FIELDS) == 10
+        # Order doesn't matter to the API; the length check catches duplicates
+        assert set(DEFAULT_FIELDS) == _EXPECTED_DEFAULT_FIELDS
+        assert len(DEFAULT_FIELDS) == len(_EXPECTED_DEFAULT_FIELDS)
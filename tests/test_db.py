@@ -8,6 +8,7 @@ These tests verify:
 """
 
 import os
+from contextlib import contextmanager
 from datetime import datetime, timedelta, timezone
 from decimal import Decimal
 
@@ -15,6 +16,10 @@ import pytest
 import psycopg2
 from psycopg2 import sql
 
+from tests.conftest import TEST_DATABASE
+
+pytestmark = pytest.mark.db
+
 
 # =============================================================================
 # Module-level setup to ensure correct environment
@@ -31,7 +36,7 @@ def _reset_test_environment():
     os.environ["PGPASSWORD"] = "postgres"
     os.environ["PGHOST"] = "localhost"
     os.environ["PGPORT"] = "5432"
-    os.environ["PGDATABASE"] = "tomorrow"
+    os.environ["PGDATABASE"] = TEST_DATABASE
     os.environ["PGUSER"] = "postgres"
 
     # Import and reload settings to pick up the new values
@@ -50,6 +55,7 @@ from tomorrow.db import (
     get_cursor,
     close_all_connections,
     get_active_locations,
+    clear_locations_cache,
     get_location_by_id,
     get_location_by_coordinates,
     insert_readings,
@@ -57,6 +63,9 @@ from tomorrow.db import (
     get_time_series,
     get_data_availability,
     health_check,
+    INSERT_PAGE_SIZE,
+    RECENT_DATA_CUTOFF,
+    TUPLE_CURSOR,
 )
 from tomorrow.models import Location, WeatherReading, LocationSummary
 
@@ -77,17 +86,61 @@ def reset_environment_session():
     yield
 
 
-@pytest.fixture(autouse=True)
+@pytest.fixture(scope="session", autouse=True)
 def reset_connection_pool():
-    """Reset connection pool before each test."""
+    """Start the session with a fresh pool and close it at the end.
+
+    The pool is reused across tests; isolation comes from the rolled-back
+    transaction fixtures below rather than from reconnecting.
+    """
     close_all_connections()
     yield
     close_all_connections()
 
 
+@pytest.fixture(scope="class")
+def db_session():
+    """Hold one connection for a test class inside a single transaction.
+
+    Every get_connection()/get_cursor() call made by the tests or by the
+    code under test reuses this connection without committing, and the
+    whole transaction is rolled back when the class finishes, so test data
+    never needs explicit DELETE cleanup.
+    """
+    import tomorrow.db
+
+    pool = get_connection_pool()
+    conn = pool.getconn()
+
+    @contextmanager
+    def held_connection():
+        yield conn
+
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(tomorrow.db, "get_connection", held_connection)
+        try:
+            yield conn
+        finally:
+            conn.rollback()
+            pool.putconn(conn)
+
+
 @pytest.fixture
-def sample_location():
-    """Create a sample location for testing."""
+def db_transaction(db_session):
+    """Undo whatever a single test writes, keeping class-level fixtures."""
+    clear_locations_cache()
+    with db_session.cursor() as cur:
+        cur.execute("SAVEPOINT test_case")
+    yield db_session
+    with db_session.cursor() as cur:
+        cur.execute("ROLLBACK TO SAVEPOINT test_case")
+    # Cached locations may include rows that were just rolled back
+    clear_locations_cache()
+
+
+@pytest.fixture(scope="class")
+def class_location(db_session):
+    """Insert the sample location once per test class."""
     with get_cursor() as db_cursor:
         db_cursor.execute(
             """
@@ -97,14 +150,14 @@ def sample_location():
             """
         )
         row = db_cursor.fetchone()
-    loc = Location.model_validate(dict(row))
-    yield loc
-    # Cleanup - use fresh connection
-    with get_cursor() as cleanup_cursor:
-        cleanup_cursor.execute(
-            "DELETE FROM weather_data WHERE location_id = %s", (loc.id,)
-        )
-        cleanup_cursor.execute("DELETE FROM locations WHERE id = %s", (loc.id,))
+    # Trusted row from our own INSERT ... RETURNING - skip re-validation
+    return Location.model_construct(**row)
+
+
+@pytest.fixture
+def sample_location(class_location, db_transaction):
+    """Sample location; anything the test writes is rolled back after it."""
+    return class_location
 
 
 @pytest.fixture
@@ -161,6 +214,12 @@ class TestConnectionPool:
             result = cur.fetchone()
             assert result["?column?"] == 1
 
+    def test_get_cursor_tuple_rows(self):
+        """Should return plain tuples with the tuple cursor factory."""
+        with get_cursor(TUPLE_CURSOR) as cur:
+            cur.execute("SELECT 1, 2")
+            assert cur.fetchone() == (1, 2)
+
     def test_close_all_connections(self):
         """Should close all connections in pool."""
         pool = get_connection_pool()
@@ -219,9 +278,21 @@ class TestLocationOperations:
         # Should not include inactive location
         assert inactive_id not in active_ids
 
-        # Cleanup
+    def test_get_active_locations_is_cached(self, sample_location):
+        """Should reuse the active locations until the cache is cleared."""
+        get_active_locations()
         with get_cursor() as db_cursor:
-            db_cursor.execute("DELETE FROM locations WHERE id = %s", (inactive_id,))
+            db_cursor.execute(
+                "UPDATE locations SET is_active = FALSE WHERE id = %s",
+                (sample_location.id,),
+            )
+
+        cached_ids = [loc.id for loc in get_active_locations()]
+        assert sample_location.id in cached_ids
+
+        clear_locations_cache()
+        fresh_ids = [loc.id for loc in get_active_locations()]
+        assert sample_location.id not in fresh_ids
 
     def test_get_location_by_id_found(self, sample_location):
         """Should return location when found."""
@@ -232,6 +303,17 @@ class TestLocationOperations:
         assert location.lat == sample_location.lat
         assert location.lon == sample_location.lon
 
+    def test_get_location_by_id_reuses_prepared_statement(
+        self, sample_location, db_transaction
+    ):
+        """Should prepare the lookup once per connection and reuse it."""
+        assert get_location_by_id(sample_location.id) is not None
+        assert "location_by_id" in db_transaction.prepared
+
+        # Second call goes straight to EXECUTE on the same connection
+        location = get_location_by_id(sample_location.id)
+        assert location.id == sample_location.id
+
     def test_get_location_by_id_not_found(self):
         """Should return None when location not found."""
         location = get_location_by_id(99999)
@@ -300,6 +382,21 @@ class TestWeatherDataOperations:
 
         assert count == 10
 
+    def test_insert_readings_counts_every_page(self, sample_location):
+        """Should report rows from all pages, not just the last one."""
+        base_time = datetime(2024, 1, 1, tzinfo=timezone.utc)
+        readings = [
+            WeatherReading(
+                location_id=sample_location.id,
+                timestamp=base_time + timedelta(minutes=i),
+                temperature=20.0,
+                data_granularity="minutely",
+            )
+            for i in range(INSERT_PAGE_SIZE + 5)
+        ]
+
+        assert insert_readings(readings) == INSERT_PAGE_SIZE + 5
+
     def test_insert_readings_empty_list(self):
         """Should handle empty list gracefully."""
         count = insert_readings([])
@@ -364,6 +461,39 @@ class TestWeatherDataOperations:
         assert readings[1].timestamp == start_time + timedelta(hours=1)
         assert readings[2].timestamp == start_time + timedelta(hours=2)
 
+    def test_get_time_series_recent_window(self, sample_location):
+        """Should return readings from the partially indexed recent window."""
+        insert_readings(
+            [
+                WeatherReading(
+                    location_id=sample_location.id,
+                    timestamp=RECENT_DATA_CUTOFF + timedelta(hours=i),
+                    temperature=float(20 + i),
+                    data_granularity="hourly",
+                )
+                for i in range(3)
+            ]
+        )
+
+        readings = get_time_series(
+            sample_location.id,
+            RECENT_DATA_CUTOFF + timedelta(hours=1),
+            RECENT_DATA_CUTOFF + timedelta(hours=2),
+            "hourly",
+        )
+
+        assert [r.temperature for r in readings] == [21.0, 22.0]
+
+    def test_get_time_series_uses_prepared_statements(
+        self, sample_location, sample_weather_readings, db_transaction
+    ):
+        """Should EXECUTE the prepared time-series and availability queries."""
+        start_time = datetime(2024, 1, 1, 12, 0, 0, tzinfo=timezone.utc)
+        get_time_series(sample_location.id, start_time, start_time, "hourly")
+        get_data_availability(sample_location.id, "hourly")
+
+        assert {"time_series", "data_availability"} <= db_transaction.prepared
+
     def test_get_time_series_empty(self, sample_location):
         """Should return empty list when no data."""
         start_time = datetime(2024, 1, 1, 12, 0, 0, tzinfo=timezone.utc)
@@ -11,7 +11,7 @@ These are integration tests that require a running database.
 
 import os
 from datetime import datetime, timedelta, timezone
-from unittest.mock import MagicMock, patch
+from unittest.mock import create_autospec, patch
 
 import pytest
 
@@ -37,7 +37,17 @@ from tomorrow.db import (
 from tomorrow.etl import run_etl_pipeline
 from tomorrow.models import Location, WeatherReading
 
-pytestmark = pytest.mark.integration
+pytestmark = [pytest.mark.integration, pytest.mark.db]
+
+# Specced once for the module and reset, not rebuilt, for each test
+_CLIENT_SPEC = create_autospec(TomorrowClient, spec_set=True, instance=True)
+
+
+@pytest.fixture
+def mock_client():
+    """API client mock that enforces TomorrowClient's method signatures."""
+    _CLIENT_SPEC.reset_mock(return_value=True, side_effect=True)
+    return _CLIENT_SPEC
 
 
 @pytest.fixture
@@ -129,15 +139,13 @@ class TestETLPipelineIntegration:
         self,
         clean_weather_data,
         mock_api_response,
+        mock_client,
     ):
         """Should run complete ETL pipeline and store data."""
         # Get first location
         locations = get_active_locations()
         test_location = locations[0]
 
-        # Create mock client with proper response structure
-        mock_client = MagicMock(spec=TomorrowClient)
-
         # Create proper mock response that matches TimelinesResponse structure
         from tomorrow.models import (
             TimelinesResponse, 
@@ -254,7 +262,7 @@ class TestDataIntegrity:
         assert count1 == 1
 
         # Second insert (should update, not error)
-        readings[0].temperature = 25.0
+        readings[0] = readings[0].model_copy(update={"temperature": 25.0})
         count2 = insert_readings(readings)
         assert count2 == 1
 
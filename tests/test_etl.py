@@ -9,7 +9,7 @@ These tests verify:
 
 import os
 from datetime import datetime, timedelta, timezone
-from unittest.mock import MagicMock, patch
+from types import SimpleNamespace
 
 import pytest
 
@@ -17,6 +17,7 @@ import pytest
 os.environ.setdefault("TOMORROW_API_KEY", "test_api_key_for_tests")
 os.environ.setdefault("PGPASSWORD", "postgres")
 
+from tomorrow.client import TomorrowAPIError
 from tomorrow.etl import (
     ETLResult,
     transform_timeline_to_readings,
@@ -36,14 +37,18 @@ from tomorrow.models import (
 )
 
 
+# Fixed timestamp for results whose times the assertions do not look at
+_T0 = datetime(2024, 1, 1, 0, 0, 0, tzinfo=timezone.utc)
+
+
 # =============================================================================
 # Fixtures
 # =============================================================================
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_location():
-    """Create a sample location."""
+    """Create a sample location (shared; no test mutates it)."""
     return Location(
         id=1,
         lat=25.86,
@@ -53,9 +58,9 @@ def sample_location():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_timelines_response():
-    """Create a mock API response."""
+    """Create a mock API response (shared; the pipeline only reads it)."""
     return TimelinesResponse(
         data=TimelinesData(
             timelines=[
@@ -199,6 +204,18 @@ class TestTransformTimelineToReadings:
         assert len(readings) == 0
 
 
+    def test_transform_unsupported_granularity(
+        self, sample_location, mock_timelines_response
+    ):
+        """Should reject granularities with no matching API timestep."""
+        with pytest.raises(ValueError, match="Unsupported granularity"):
+            transform_timeline_to_readings(
+                location=sample_location,
+                response=mock_timelines_response,
+                granularity="weekly",
+            )
+
+
 # =============================================================================
 # ETLResult Tests
 # =============================================================================
@@ -215,8 +232,8 @@ class TestETLResult:
             locations_failed=0,
             errors=[],
             duration_seconds=30.5,
-            started_at=datetime.now(timezone.utc),
-            completed_at=datetime.now(timezone.utc),
+            started_at=_T0,
+            completed_at=_T0,
         )
 
         assert result.success is True
@@ -230,8 +247,8 @@ class TestETLResult:
             locations_failed=2,
             errors=["Error 1", "Error 2"],
             duration_seconds=30.5,
-            started_at=datetime.now(timezone.utc),
-            completed_at=datetime.now(timezone.utc),
+            started_at=_T0,
+            completed_at=_T0,
         )
 
         assert result.success is False
@@ -243,32 +260,116 @@ class TestETLResult:
 # =============================================================================
 
 
+class FakeClient:
+    """Stand-in for TomorrowClient that replays canned responses in order.
+
+    Exceptions in the list are raised instead of returned; the last entry
+    keeps being used once the list runs out.
+    """
+
+    def __init__(self, *responses):
+        self.responses = responses
+        self.calls = []
+        self.closed = False
+
+    def fetch_weather(self, **kwargs):
+        self.calls.append(kwargs)
+        response = self.responses[min(len(self.calls), len(self.responses)) - 1]
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+    def close(self):
+        self.closed = True
+
+
+class FakeClock:
+    """Stand-in for the time module with scripted monotonic() readings."""
+
+    def __init__(self, *readings):
+        self.readings = iter(readings)
+        self.sleeps = []
+
+    def monotonic(self):
+        return next(self.readings)
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+
+
+@pytest.fixture
+def fake_etl(monkeypatch):
+    """Swap the pipeline's database calls for plain functions.
+
+    Returns a namespace: set .locations / .insert_error to script the
+    database, read .inserted for the batches passed to insert_readings.
+    Request spacing is disabled so multi-location tests do not sleep.
+    """
+    db = SimpleNamespace(locations=[], inserted=[], insert_error=None)
+
+    def insert_readings(readings):
+        if db.insert_error is not None:
+            raise db.insert_error
+        db.inserted.append(readings)
+        return len(readings)
+
+    monkeypatch.setattr("tomorrow.etl.get_active_locations", lambda: db.locations)
+    monkeypatch.setattr("tomorrow.etl.insert_readings", insert_readings)
+    monkeypatch.setattr("tomorrow.etl.REQUEST_INTERVAL_SECONDS", 0)
+    return db
+
+
 class TestRunETLPipeline:
     """Tests for full ETL pipeline execution."""
 
-    @patch("tomorrow.etl.get_active_locations")
-    @patch("tomorrow.etl.insert_readings")
-    def test_full_pipeline_success(
+    @pytest.mark.parametrize(
+        "inject_client,time_range",
+        [
+            (True, None),
+            (
+                True,
+                (
+                    datetime(2024, 1, 1, 0, 0, 0, tzinfo=timezone.utc),
+                    datetime(2024, 1, 2, 0, 0, 0, tzinfo=timezone.utc),
+                ),
+            ),
+            (False, None),
+        ],
+        ids=["injected_client", "custom_time_range", "creates_client"],
+    )
+    def test_pipeline_happy_path(
         self,
-        mock_insert,
-        mock_get_locations,
+        fake_etl,
+        monkeypatch,
         sample_location,
         mock_timelines_response,
+        inject_client,
+        time_range,
     ):
-        """Should run full pipeline successfully."""
-        # Setup mocks
-        mock_get_locations.return_value = [sample_location]
-        mock_insert.return_value = 2
+        """Should run the full pipeline with an injected or created client."""
+        fake_etl.locations = [sample_location]
+
+        created = []
+
+        def make_client():
+            created.append(FakeClient(mock_timelines_response))
+            return created[-1]
+
+        if inject_client:
+            client = make_client()
+        else:
+            client = None
+            monkeypatch.setattr("tomorrow.etl.TomorrowClient", make_client)
 
-        # Mock API client
-        mock_client = MagicMock()
-        mock_client.fetch_weather.return_value = mock_timelines_response
+        start_time, end_time = time_range or (None, None)
 
         # Run pipeline
         result = run_etl_pipeline(
-            client=mock_client,
+            client=client,
             locations=[sample_location],
             granularity="hourly",
+            start_time=start_time,
+            end_time=end_time,
         )
 
         # Verify results
@@ -278,31 +379,30 @@ class TestRunETLPipeline:
         assert result.readings_inserted == 2
         assert len(result.errors) == 0
 
-        # Verify mocks called
-        mock_client.fetch_weather.assert_called_once()
-        mock_insert.assert_called_once()
+        # Verify fakes called
+        assert len(created) == 1
+        assert len(created[0].calls) == 1
+        assert len(fake_etl.inserted) == 1
 
-    @patch("tomorrow.etl.get_active_locations")
-    @patch("tomorrow.etl.insert_readings")
-    def test_pipeline_with_api_error(
-        self,
-        mock_insert,
-        mock_get_locations,
-        sample_location,
-    ):
-        """Should handle API errors gracefully."""
-        from tomorrow.client import TomorrowAPIError
+        # A client the pipeline created is closed by it; an injected one is not
+        assert created[0].closed is not inject_client
+
+        if time_range:
+            # Verify time parameters passed to API
+            call_kwargs = created[0].calls[-1]
+            assert call_kwargs["start_time"] == "2024-01-01T00:00:00Z"
+            assert call_kwargs["end_time"] == "2024-01-02T00:00:00Z"
 
-        # Setup mocks
-        mock_get_locations.return_value = [sample_location]
+    def test_pipeline_with_api_error(self, fake_etl, sample_location):
+        """Should handle API errors gracefully."""
+        fake_etl.locations = [sample_location]
 
-        # Mock API client that raises error
-        mock_client = MagicMock()
-        mock_client.fetch_weather.side_effect = TomorrowAPIError("API Error")
+        # API client that raises error
+        client = FakeClient(TomorrowAPIError("API Error"))
 
         # Run pipeline
         result = run_etl_pipeline(
-            client=mock_client,
+            client=client,
             locations=[sample_location],
         )
 
@@ -313,36 +413,28 @@ class TestRunETLPipeline:
         assert result.readings_inserted == 0
         assert len(result.errors) == 1
 
-    @patch("tomorrow.etl.get_active_locations")
-    @patch("tomorrow.etl.insert_readings")
     def test_pipeline_multiple_locations_partial_failure(
-        self,
-        mock_insert,
-        mock_get_locations,
-        mock_timelines_response,
+        self, fake_etl, mock_timelines_response
     ):
         """Should continue processing when some locations fail."""
-        from tomorrow.client import TomorrowAPIError
-
         locations = [
             Location(id=1, lat=25.86, lon=-97.42, name="Loc 1", is_active=True),
             Location(id=2, lat=26.20, lon=-98.23, name="Loc 2", is_active=True),
             Location(id=3, lat=29.76, lon=-95.37, name="Loc 3", is_active=True),
         ]
 
-        mock_get_locations.return_value = locations
+        fake_etl.locations = locations
 
-        # Mock API client - second location fails
-        mock_client = MagicMock()
-        mock_client.fetch_weather.side_effect = [
+        # API client - second location fails
+        client = FakeClient(
             mock_timelines_response,  # Loc 1 succeeds
             TomorrowAPIError("API Error"),  # Loc 2 fails
             mock_timelines_response,  # Loc 3 succeeds
-        ]
+        )
 
         # Run pipeline
         result = run_etl_pipeline(
-            client=mock_client,
+            client=client,
             locations=locations,
         )
 
@@ -352,16 +444,28 @@ class TestRunETLPipeline:
         assert result.locations_failed == 1
         assert result.readings_inserted == 4  # 2 readings per successful location
 
-    @patch("tomorrow.etl.get_active_locations")
-    @patch("tomorrow.etl.insert_readings")
-    def test_pipeline_no_locations(
-        self,
-        mock_insert,
-        mock_get_locations,
+    def test_pipeline_request_spacing_counts_fetch_time(
+        self, fake_etl, monkeypatch, mock_timelines_response
     ):
-        """Should handle empty locations list."""
-        mock_get_locations.return_value = []
+        """Should only sleep for what remains of the request interval."""
+        locations = [
+            Location(id=1, lat=25.86, lon=-97.42, name="Loc 1", is_active=True),
+            Location(id=2, lat=26.20, lon=-98.23, name="Loc 2", is_active=True),
+        ]
+
+        # First request starts at 0s; the second is ready to go at 1s
+        clock = FakeClock(0.0, 1.0, 3.0)
+        monkeypatch.setattr("tomorrow.etl.time", clock)
+        monkeypatch.setattr("tomorrow.etl.REQUEST_INTERVAL_SECONDS", 3.0)
+
+        run_etl_pipeline(
+            client=FakeClient(mock_timelines_response), locations=locations
+        )
 
+        assert clock.sleeps == [2.0]
+
+    def test_pipeline_no_locations(self, fake_etl):
+        """Should handle empty locations list."""
         result = run_etl_pipeline(locations=[])
 
         # success=True means no location API calls failed
@@ -370,81 +474,15 @@ class TestRunETLPipeline:
         assert result.readings_inserted == 0
         assert "No active locations found" in result.errors[0]
 
-    @patch("tomorrow.etl.get_active_locations")
-    @patch("tomorrow.etl.insert_readings")
-    def test_pipeline_custom_time_range(
-        self,
-        mock_insert,
-        mock_get_locations,
-        sample_location,
-        mock_timelines_response,
-    ):
-        """Should support custom time range."""
-        mock_get_locations.return_value = [sample_location]
-        mock_insert.return_value = 2
-
-        mock_client = MagicMock()
-        mock_client.fetch_weather.return_value = mock_timelines_response
-
-        start_time = datetime(2024, 1, 1, 0, 0, 0, tzinfo=timezone.utc)
-        end_time = datetime(2024, 1, 2, 0, 0, 0, tzinfo=timezone.utc)
-
-        result = run_etl_pipeline(
-            client=mock_client,
-            locations=[sample_location],
-            start_time=start_time,
-            end_time=end_time,
-        )
-
-        assert result.success is True
-
-        # Verify time parameters passed to API
-        call_kwargs = mock_client.fetch_weather.call_args[1]
-        assert call_kwargs["start_time"] == "2024-01-01T00:00:00Z"
-        assert call_kwargs["end_time"] == "2024-01-02T00:00:00Z"
-
-    @patch("tomorrow.etl.get_active_locations")
-    @patch("tomorrow.etl.insert_readings")
-    def test_pipeline_creates_client_if_not_provided(
-        self,
-        mock_insert,
-        mock_get_locations,
-        sample_location,
-        mock_timelines_response,
-    ):
-        """Should create API client if not provided."""
-        mock_get_locations.return_value = [sample_location]
-        mock_insert.return_value = 2
-
-        with patch("tomorrow.etl.TomorrowClient") as mock_client_class:
-            mock_client = MagicMock()
-            mock_client.fetch_weather.return_value = mock_timelines_response
-            mock_client_class.return_value = mock_client
-
-            result = run_etl_pipeline(locations=[sample_location])
-
-            assert result.success is True
-            mock_client_class.assert_called_once()
-            mock_client.close.assert_called_once()
-
-    @patch("tomorrow.etl.get_active_locations")
-    @patch("tomorrow.etl.insert_readings")
     def test_pipeline_database_insert_failure(
-        self,
-        mock_insert,
-        mock_get_locations,
-        sample_location,
-        mock_timelines_response,
+        self, fake_etl, sample_location, mock_timelines_response
     ):
         """Should handle database insert failures."""
-        mock_get_locations.return_value = [sample_location]
-        mock_insert.side_effect = Exception("DB Error")
-
-        mock_client = MagicMock()
-        mock_client.fetch_weather.return_value = mock_timelines_response
+        fake_etl.locations = [sample_location]
+        fake_etl.insert_error = Exception("DB Error")
 
         result = run_etl_pipeline(
-            client=mock_client,
+            client=FakeClient(mock_timelines_response),
             locations=[sample_location],
         )
 
@@ -464,28 +502,28 @@ class TestRunETLPipeline:
 class TestConvenienceFunctions:
     """Tests for run_hourly_pipeline and run_minutely_pipeline."""
 
-    @patch("tomorrow.etl.run_etl_pipeline")
-    def test_run_hourly_pipeline(self, mock_run):
-        """Should run pipeline with hourly settings."""
-        mock_run.return_value = MagicMock(success=True)
+    @pytest.fixture
+    def pipeline_calls(self, monkeypatch):
+        """Record run_etl_pipeline kwargs instead of running it."""
+        calls = []
+
+        def run_etl_pipeline(**kwargs):
+            calls.append(kwargs)
+            return SimpleNamespace(success=True)
+
+        monkeypatch.setattr("tomorrow.etl.run_etl_pipeline", run_etl_pipeline)
+        return calls
 
+    def test_run_hourly_pipeline(self, pipeline_calls):
+        """Should run pipeline with hourly settings."""
         result = run_hourly_pipeline()
 
-        mock_run.assert_called_once_with(
-            granularity="hourly",
-            timesteps="1h",
-        )
+        assert pipeline_calls == [{"granularity": "hourly", "timesteps": "1h"}]
         assert result.success is True
 
-    @patch("tomorrow.etl.run_etl_pipeline")
-    def test_run_minutely_pipeline(self, mock_run):
+    def test_run_minutely_pipeline(self, pipeline_calls):
         """Should run pipeline with minutely settings."""
-        mock_run.return_value = MagicMock(success=True)
-
         result = run_minutely_pipeline()
 
-        mock_run.assert_called_once_with(
-            granularity="minutely",
-            timesteps="1m",
-        )
+        assert pipeline_calls == [{"granularity": "minutely", "timesteps": "1m"}]
         assert result.success is True
@@ -7,47 +7,27 @@ These tests verify:
 - Rollback works
 """
 
-import os
-from decimal import Decimal
-
 import pytest
 import psycopg2
 from psycopg2 import errors as pg_errors
 from psycopg2.extras import RealDictCursor
 
-
-# The 10 locations from ASSIGNMENT.md
-EXPECTED_LOCATIONS = [
-    (Decimal("25.8600"), Decimal("-97.4200")),
-    (Decimal("25.9000"), Decimal("-97.5200")),
-    (Decimal("25.9000"), Decimal("-97.4800")),
-    (Decimal("25.9000"), Decimal("-97.4400")),
-    (Decimal("25.9000"), Decimal("-97.4000")),
-    (Decimal("25.9200"), Decimal("-97.3800")),
-    (Decimal("25.9400"), Decimal("-97.5400")),
-    (Decimal("25.9400"), Decimal("-97.5200")),
-    (Decimal("25.9400"), Decimal("-97.4800")),
-    (Decimal("25.9400"), Decimal("-97.4400")),
-]
-
-
-def get_db_connection():
-    """Get a database connection using environment variables."""
-    return psycopg2.connect(
-        host=os.getenv("PGHOST", "localhost"),
-        port=os.getenv("PGPORT", "5432"),
-        database=os.getenv("PGDATABASE", "tomorrow"),
-        user=os.getenv("PGUSER", "postgres"),
-        password=os.getenv("PGPASSWORD", "postgres"),
-    )
+pytestmark = pytest.mark.db
 
 
-@pytest.fixture
-def db_conn():
-    """Provide a database connection for tests."""
-    conn = get_db_connection()
-    yield conn
-    conn.close()
+# The 10 locations from ASSIGNMENT.md
+EXPECTED_LOCATIONS = (
+    (25.86, -97.42),
+    (25.90, -97.52),
+    (25.90, -97.48),
+    (25.90, -97.44),
+    (25.90, -97.40),
+    (25.92, -97.38),
+    (25.94, -97.54),
+    (25.94, -97.52),
+    (25.94, -97.48),
+    (25.94, -97.44),
+)
 
 
 @pytest.fixture
@@ -56,31 +36,95 @@ def cursor(db_conn):
     cur = db_conn.cursor(cursor_factory=RealDictCursor)
     yield cur
     cur.close()
+    # Leave the shared connection clean for the next test
+    db_conn.rollback()
+
+
+# All schema metadata the structure tests check, fetched in one round-trip
+SCHEMA_FACTS_QUERY = """
+    SELECT json_build_object(
+        'table_exists', EXISTS (
+            SELECT FROM information_schema.tables
+            WHERE table_name = 'locations'
+        ),
+        'columns', (
+            SELECT json_object_agg(
+                column_name,
+                json_build_object('data_type', data_type, 'is_nullable', is_nullable)
+            )
+            FROM information_schema.columns
+            WHERE table_name = 'locations'
+        ),
+        'primary_key', (
+            SELECT json_agg(kcu.column_name)
+            FROM information_schema.table_constraints tc
+            JOIN information_schema.key_column_usage kcu
+                ON tc.constraint_name = kcu.constraint_name
+            WHERE tc.table_name = 'locations'
+                AND tc.constraint_type = 'PRIMARY KEY'
+        ),
+        'unique_constraints', (
+            SELECT COALESCE(json_agg(constraint_name), '[]')
+            FROM information_schema.table_constraints
+            WHERE table_name = 'locations'
+                AND constraint_type = 'UNIQUE'
+        ),
+        'check_constraints', (
+            SELECT COALESCE(json_agg(constraint_name), '[]')
+            FROM information_schema.check_constraints
+            WHERE constraint_name IN ('valid_lat', 'valid_lon')
+        ),
+        'indexes', (
+            SELECT COALESCE(json_agg(indexname), '[]')
+            FROM pg_indexes
+            WHERE tablename = 'locations'
+        )
+    ) AS facts;
+"""
+
+# Default location data the seed tests check, fetched in one round-trip
+LOCATION_FACTS_QUERY = """
+    SELECT json_build_object(
+        'count', COUNT(*),
+        'active_count', COUNT(*) FILTER (WHERE is_active),
+        'unnamed_count', COUNT(*) FILTER (WHERE name IS NULL),
+        'coordinates', json_agg(json_build_array(lat, lon) ORDER BY id)
+    ) AS facts
+    FROM locations;
+"""
+
+
+def fetch_facts(conn, query):
+    """Run a single-row JSON facts query."""
+    with conn.cursor() as cur:
+        cur.execute(query)
+        facts = cur.fetchone()[0]
+    conn.rollback()
+    return facts
+
+
+@pytest.fixture(scope="class")
+def schema_facts(db_conn):
+    """Schema metadata for the locations table, queried once per class."""
+    return fetch_facts(db_conn, SCHEMA_FACTS_QUERY)
+
+
+@pytest.fixture(scope="class")
+def location_facts(db_conn):
+    """Default location data, queried once per class."""
+    return fetch_facts(db_conn, LOCATION_FACTS_QUERY)
 
 
 class TestLocationsTableStructure:
     """Tests for the locations table schema."""
 
-    def test_table_exists(self, cursor):
+    def test_table_exists(self, schema_facts):
         """Locations table should exist."""
-        cursor.execute("""
-            SELECT EXISTS (
-                SELECT FROM information_schema.tables 
-                WHERE table_name = 'locations'
-            );
-        """)
-        result = cursor.fetchone()
-        assert result["exists"] is True
+        assert schema_facts["table_exists"] is True
 
-    def test_required_columns_exist(self, cursor):
+    def test_required_columns_exist(self, schema_facts):
         """Table should have all required columns."""
-        cursor.execute("""
-            SELECT column_name, data_type, is_nullable
-            FROM information_schema.columns
-            WHERE table_name = 'locations'
-            ORDER BY ordinal_position;
-        """)
-        columns = {row["column_name"]: row for row in cursor.fetchall()}
+        columns = schema_facts["columns"]
 
         assert "id" in columns
         assert "lat" in columns
@@ -97,96 +141,55 @@ class TestLocationsTableStructure:
         assert columns["lat"]["is_nullable"] == "NO"
         assert columns["lon"]["is_nullable"] == "NO"
 
-    def test_primary_key_exists(self, cursor):
+    def test_primary_key_exists(self, schema_facts):
         """Table should have a primary key on id."""
-        cursor.execute("""
-            SELECT kcu.column_name
-            FROM information_schema.table_constraints tc
-            JOIN information_schema.key_column_usage kcu 
-                ON tc.constraint_name = kcu.constraint_name
-            WHERE tc.table_name = 'locations'
-                AND tc.constraint_type = 'PRIMARY KEY';
-        """)
-        result = cursor.fetchone()
-        assert result["column_name"] == "id"
+        assert schema_facts["primary_key"] == ["id"]
 
-    def test_unique_constraint_on_coordinates(self, cursor):
+    def test_unique_constraint_on_coordinates(self, schema_facts):
         """Should have unique constraint on (lat, lon)."""
-        cursor.execute("""
-            SELECT COUNT(*) as count
-            FROM information_schema.table_constraints
-            WHERE table_name = 'locations'
-                AND constraint_type = 'UNIQUE'
-                AND constraint_name = 'unique_coordinates';
-        """)
-        result = cursor.fetchone()
-        assert result["count"] == 1
+        assert schema_facts["unique_constraints"].count("unique_coordinates") == 1
 
-    def test_check_constraints_exist(self, cursor):
+    def test_check_constraints_exist(self, schema_facts):
         """Should have check constraints for lat/lon validation."""
-        cursor.execute("""
-            SELECT constraint_name
-            FROM information_schema.check_constraints
-            WHERE constraint_name IN ('valid_lat', 'valid_lon');
-        """)
-        constraints = [row["constraint_name"] for row in cursor.fetchall()]
+        constraints = schema_facts["check_constraints"]
         assert "valid_lat" in constraints
         assert "valid_lon" in constraints
 
-    def test_active_index_exists(self, cursor):
+    def test_active_index_exists(self, schema_facts):
         """Should have index on is_active for filtered queries."""
-        cursor.execute("""
-            SELECT indexname
-            FROM pg_indexes
-            WHERE tablename = 'locations'
-                AND indexname = 'idx_locations_active';
-        """)
-        result = cursor.fetchone()
-        assert result is not None
+        assert "idx_locations_active" in schema_facts["indexes"]
 
 
 class TestDefaultLocations:
     """Tests for the default 10 locations from ASSIGNMENT.md."""
 
-    def test_all_ten_locations_inserted(self, cursor):
+    def test_all_ten_locations_inserted(self, location_facts):
         """All 10 locations should be present."""
-        cursor.execute("SELECT COUNT(*) as count FROM locations;")
-        result = cursor.fetchone()
-        assert result["count"] == 10
+        assert location_facts["count"] == 10
 
-    def test_location_coordinates_match(self, cursor):
+    def test_location_coordinates_match(self, location_facts):
         """Coordinates should match ASSIGNMENT.md exactly."""
-        cursor.execute("SELECT lat, lon FROM locations ORDER BY id;")
-        actual = [(row["lat"], row["lon"]) for row in cursor.fetchall()]
+        actual = tuple(map(tuple, location_facts["coordinates"]))
 
-        assert len(actual) == 10
-        for expected, actual_coords in zip(EXPECTED_LOCATIONS, actual):
-            assert actual_coords[0] == expected[0], (
-                f"Latitude mismatch: {actual_coords[0]} != {expected[0]}"
-            )
-            assert actual_coords[1] == expected[1], (
-                f"Longitude mismatch: {actual_coords[1]} != {expected[1]}"
-            )
+        assert actual == EXPECTED_LOCATIONS
 
-    def test_locations_are_active(self, cursor):
+    def test_locations_are_active(self, location_facts):
         """All default locations should be active."""
-        cursor.execute(
-            "SELECT COUNT(*) as count FROM locations WHERE is_active = TRUE;"
-        )
-        result = cursor.fetchone()
-        assert result["count"] == 10
+        assert location_facts["active_count"] == 10
 
-    def test_locations_have_names(self, cursor):
+    def test_locations_have_names(self, location_facts):
         """All locations should have descriptive names."""
-        cursor.execute("SELECT name FROM locations WHERE name IS NULL;")
-        result = cursor.fetchone()
-        assert result is None
+        assert location_facts["unnamed_count"] == 0
 
 
 class TestConstraints:
-    """Tests for database constraints."""
+    """Tests for database constraints.
+
+    Violations are raised by the INSERT itself, so nothing is committed;
+    the cursor fixture rolls the aborted transaction back.
+    """
 
-    def test_duplicate_coordinates_rejected(self, db_conn, cursor):
+    def test_duplicate_coordinates_rejected(self, cursor):
         """Should reject duplicate lat/lon combinations."""
         # Try to insert a duplicate
         with pytest.raises(psycopg2.IntegrityError):
@@ -194,43 +197,30 @@ class TestConstraints:
                 INSERT INTO locations (lat, lon, name)
                 VALUES (25.8600, -97.4200, 'Duplicate');
             """)
-            db_conn.commit()
 
-        # Rollback the failed transaction
-        db_conn.rollback()
-
-    def test_invalid_latitude_rejected(self, db_conn, cursor):
+    def test_invalid_latitude_rejected(self, cursor):
         """Should reject latitudes outside -90 to 90."""
         with pytest.raises(pg_errors.CheckViolation):
             cursor.execute("""
                 INSERT INTO locations (lat, lon, name)
                 VALUES (100.0, -97.4200, 'Invalid Lat');
             """)
-            db_conn.commit()
-
-        db_conn.rollback()
 
-    def test_invalid_longitude_rejected(self, db_conn, cursor):
+    def test_invalid_longitude_rejected(self, cursor):
         """Should reject longitudes outside -180 to 180."""
         with pytest.raises(pg_errors.CheckViolation):
             cursor.execute("""
                 INSERT INTO locations (lat, lon, name)
                 VALUES (25.8600, 200.0, 'Invalid Lon');
             """)
-            db_conn.commit()
 
-        db_conn.rollback()
-
-    def test_null_latitude_rejected(self, db_conn, cursor):
+    def test_null_latitude_rejected(self, cursor):
         """Should reject NULL latitude."""
         with pytest.raises(pg_errors.NotNullViolation):
             cursor.execute("""
                 INSERT INTO locations (lat, lon, name)
                 VALUES (NULL, -97.4200, 'Null Lat');
             """)
-            db_conn.commit()
-
-        db_conn.rollback()
 
 
 class TestDataTypes:
@@ -8,7 +8,8 @@ These tests verify:
 
 import os
 from argparse import Namespace
-from unittest.mock import MagicMock, patch
+from types import SimpleNamespace
+from unittest.mock import MagicMock
 
 import pytest
 
@@ -25,32 +26,46 @@ from tomorrow.__main__ import (
 )
 
 
+def patch_main(monkeypatch, *names):
+    """Replace tomorrow.__main__ attributes with MagicMocks.
+
+    Returns:
+        Namespace of the mocks, keyed by attribute name
+    """
+    mocks = SimpleNamespace(**{name: MagicMock() for name in names})
+    for name in names:
+        monkeypatch.setattr(f"tomorrow.__main__.{name}", getattr(mocks, name))
+    return mocks
+
+
 # =============================================================================
 # Parser Tests
 # =============================================================================
 
 
+@pytest.fixture(scope="module")
+def parser():
+    """One parser for the module; parse_args() does not mutate it."""
+    return create_parser()
+
+
 class TestCreateParser:
     """Tests for argument parser."""
 
-    def test_parser_creates_subparsers(self):
+    def test_parser_creates_subparsers(self, parser):
         """Should create subparsers for commands."""
-        parser = create_parser()
-
         # Should have subparsers
         assert parser._subparsers is not None
 
-    def test_run_command_parsing(self):
+    def test_run_command_parsing(self, parser):
         """Should parse run command."""
-        parser = create_parser()
         args = parser.parse_args(["run"])
 
         assert args.command == "run"
         assert args.func == cmd_run
 
-    def test_scheduler_command_parsing_defaults(self):
+    def test_scheduler_command_parsing_defaults(self, parser):
         """Should parse scheduler command with defaults."""
-        parser = create_parser()
         args = parser.parse_args(["scheduler"])
 
         assert args.command == "scheduler"
@@ -58,27 +73,23 @@ class TestCreateParser:
         assert args.minutely is False
         assert args.minutely_interval == 15
 
-    def test_scheduler_command_parsing_with_options(self):
+    def test_scheduler_command_parsing_with_options(self, parser):
         """Should parse scheduler command with options."""
-        parser = create_parser()
         args = parser.parse_args(["scheduler", "-m", "--minutely-interval", "30"])
 
         assert args.command == "scheduler"
         assert args.minutely is True
         assert args.minutely_interval == 30
 
-    def test_migrate_command_parsing(self):
+    def test_migrate_command_parsing(self, parser):
         """Should parse migrate command."""
-        parser = create_parser()
         args = parser.parse_args(["migrate"])
 
         assert args.command == "migrate"
         assert args.func == cmd_migrate
 
-    def test_no_command_parsing(self):
+    def test_no_command_parsing(self, parser):
         """Should parse empty args without error."""
-        parser = create_parser()
-
         # argparse doesn't exit for subparsers, just returns None
         args = parser.parse_args([])
 
@@ -93,51 +104,50 @@ class TestCreateParser:
 class TestCmdRun:
     """Tests for run command."""
 
-    @patch("tomorrow.__main__.health_check")
-    @patch("tomorrow.__main__.run_hourly_pipeline")
-    def test_run_success(self, mock_pipeline, mock_health):
+    @pytest.fixture(autouse=True)
+    def patched_main(self, monkeypatch):
+        return patch_main(monkeypatch, "health_check", "run_hourly_pipeline")
+
+    def test_run_success(self, patched_main):
         """Should return 0 on successful run."""
-        mock_health.return_value = True
+        patched_main.health_check.return_value = True
 
         # Create successful result
-        mock_result = MagicMock()
-        mock_result.success = True
-        mock_result.locations_processed = 10
-        mock_result.readings_inserted = 1440
-        mock_result.duration_seconds = 45.0
-        mock_result.errors = []
-        mock_pipeline.return_value = mock_result
+        patched_main.run_hourly_pipeline.return_value = SimpleNamespace(
+            success=True,
+            locations_processed=10,
+            readings_inserted=1440,
+            duration_seconds=45.0,
+            errors=[],
+        )
 
         args = Namespace()
         exit_code = cmd_run(args)
 
         assert exit_code == 0
-        mock_health.assert_called_once()
-        mock_pipeline.assert_called_once()
+        patched_main.health_check.assert_called_once()
+        patched_main.run_hourly_pipeline.assert_called_once()
 
-    @patch("tomorrow.__main__.health_check")
-    def test_run_health_check_fails(self, mock_health):
+    def test_run_health_check_fails(self, patched_main):
         """Should return 1 when health check fails."""
-        mock_health.return_value = False
+        patched_main.health_check.return_value = False
 
         args = Namespace()
         exit_code = cmd_run(args)
 
         assert exit_code == 1
-        mock_health.assert_called_once()
+        patched_main.health_check.assert_called_once()
 
-    @patch("tomorrow.__main__.health_check")
-    @patch("tomorrow.__main__.run_hourly_pipeline")
-    def test_run_pipeline_fails(self, mock_pipeline, mock_health):
+    def test_run_pipeline_fails(self, patched_main):
         """Should return 1 when pipeline fails."""
-        mock_health.return_value = True
+        patched_main.health_check.return_value = True
 
         # Create failed result
-        mock_result = MagicMock()
-        mock_result.success = False
-        mock_result.locations_failed = 2
-        mock_result.errors = ["Error 1", "Error 2"]
-        mock_pipeline.return_value = mock_result
+        patched_main.run_hourly_pipeline.return_value = SimpleNamespace(
+            success=False,
+            locations_failed=2,
+            errors=["Error 1", "Error 2"],
+        )
 
         args = Namespace()
         exit_code = cmd_run(args)
@@ -153,60 +163,62 @@ class TestCmdRun:
 class TestCmdScheduler:
     """Tests for scheduler command."""
 
-    @patch("tomorrow.__main__.health_check")
-    @patch("tomorrow.__main__.setup_signal_handlers")
-    @patch("tomorrow.__main__.start_scheduler")
-    def test_scheduler_success(self, mock_start, mock_signals, mock_health):
+    @pytest.fixture(autouse=True)
+    def patched_main(self, monkeypatch):
+        # check_and_run_initial_fetch too: left real, it runs the whole
+        # pipeline against the API whenever a database is reachable
+        return patch_main(
+            monkeypatch,
+            "health_check",
+            "setup_signal_handlers",
+            "check_and_run_initial_fetch",
+            "start_scheduler",
+        )
+
+    def test_scheduler_success(self, patched_main):
         """Should start scheduler successfully."""
-        mock_health.return_value = True
-        mock_start.return_value = None  # Blocks, but we mock it
+        patched_main.health_check.return_value = True
+        patched_main.start_scheduler.return_value = None  # Blocks, but we mock it
 
         args = Namespace(minutely=False, minutely_interval=15)
         exit_code = cmd_scheduler(args)
 
         assert exit_code == 0
-        mock_health.assert_called_once()
-        mock_signals.assert_called_once()
-        mock_start.assert_called_once_with(
+        patched_main.health_check.assert_called_once()
+        patched_main.setup_signal_handlers.assert_called_once()
+        patched_main.start_scheduler.assert_called_once_with(
             run_hourly=True,
             run_minutely=False,
             minutely_interval=15,
         )
 
-    @patch("tomorrow.__main__.health_check")
-    @patch("tomorrow.__main__.setup_signal_handlers")
-    @patch("tomorrow.__main__.start_scheduler")
-    def test_scheduler_with_minutely(self, mock_start, mock_signals, mock_health):
+    def test_scheduler_with_minutely(self, patched_main):
         """Should start scheduler with minutely jobs."""
-        mock_health.return_value = True
-        mock_start.return_value = None
+        patched_main.health_check.return_value = True
+        patched_main.start_scheduler.return_value = None
 
         args = Namespace(minutely=True, minutely_interval=30)
         exit_code = cmd_scheduler(args)
 
-        mock_start.assert_called_once_with(
+        patched_main.start_scheduler.assert_called_once_with(
             run_hourly=True,
             run_minutely=True,
             minutely_interval=30,
         )
 
-    @patch("tomorrow.__main__.health_check")
-    def test_scheduler_health_check_fails(self, mock_health):
+    def test_scheduler_health_check_fails(self, patched_main):
         """Should return 1 when health check fails."""
-        mock_health.return_value = False
+        patched_main.health_check.return_value = False
 
         args = Namespace(minutely=False, minutely_interval=15)
         exit_code = cmd_scheduler(args)
 
         assert exit_code == 1
 
-    @patch("tomorrow.__main__.health_check")
-    @patch("tomorrow.__main__.setup_signal_handlers")
-    @patch("tomorrow.__main__.start_scheduler")
-    def test_scheduler_exception(self, mock_start, mock_signals, mock_health):
+    def test_scheduler_exception(self, patched_main):
         """Should return 1 on scheduler exception."""
-        mock_health.return_value = True
-        mock_start.side_effect = Exception("Scheduler error")
+        patched_main.health_check.return_value = True
+        patched_main.start_scheduler.side_effect = Exception("Scheduler error")
 
         args = Namespace(minutely=False, minutely_interval=15)
         exit_code = cmd_scheduler(args)
@@ -222,21 +234,23 @@ class TestCmdScheduler:
 class TestCmdMigrate:
     """Tests for migrate command."""
 
-    @patch("tomorrow.__main__.run_migrations")
-    def test_migrate_success(self, mock_migrations):
+    @pytest.fixture(autouse=True)
+    def patched_main(self, monkeypatch):
+        return patch_main(monkeypatch, "run_migrations")
+
+    def test_migrate_success(self, patched_main):
         """Should return 0 on successful migration."""
-        mock_migrations.return_value = None
+        patched_main.run_migrations.return_value = None
 
         args = Namespace()
         exit_code = cmd_migrate(args)
 
         assert exit_code == 0
-        mock_migrations.assert_called_once()
+        patched_main.run_migrations.assert_called_once()
 
-    @patch("tomorrow.__main__.run_migrations")
-    def test_migrate_failure(self, mock_migrations):
+    def test_migrate_failure(self, patched_main):
         """Should return 1 on migration failure."""
-        mock_migrations.side_effect = Exception("Migration error")
+        patched_main.run_migrations.side_effect = Exception("Migration error")
 
         args = Namespace()
         exit_code = cmd_migrate(args)
@@ -252,58 +266,59 @@ class TestCmdMigrate:
 class TestMain:
     """Tests for main entry point."""
 
-    @patch("tomorrow.__main__.create_parser")
-    @patch("tomorrow.__main__.configure_logging")
-    @patch("tomorrow.__main__.get_settings")
-    def test_main_no_command(self, mock_settings, mock_logging, mock_parser):
+    @pytest.fixture(autouse=True)
+    def main_env(self, monkeypatch):
+        """Stub the parser, logging and settings; tests set main_env.args.
+
+        main() only calls parse_args() and print_help() on the parser, so
+        plain stand-ins replace the MagicMock chain.
+        """
+        env = SimpleNamespace(args=None, help_calls=[])
+        parser = SimpleNamespace(
+            parse_args=lambda: env.args,
+            print_help=lambda: env.help_calls.append(True),
+        )
+        monkeypatch.setattr("tomorrow.__main__.create_parser", lambda: parser)
+        monkeypatch.setattr(
+            "tomorrow.__main__.configure_logging", lambda **kwargs: None
+        )
+        monkeypatch.setattr(
+            "tomorrow.__main__.get_settings",
+            lambda: SimpleNamespace(log_level="INFO"),
+        )
+        return env
+
+    def test_main_no_command(self, main_env):
         """Should print help and return 1 when no command."""
-        mock_args = MagicMock()
-        mock_args.command = None
-        mock_parser.return_value.parse_args.return_value = mock_args
+        main_env.args = SimpleNamespace(command=None)
 
         exit_code = main()
 
         assert exit_code == 1
-        mock_parser.return_value.print_help.assert_called_once()
+        assert len(main_env.help_calls) == 1
 
-    @patch("tomorrow.__main__.create_parser")
-    @patch("tomorrow.__main__.configure_logging")
-    @patch("tomorrow.__main__.get_settings")
-    def test_main_successful_command(self, mock_settings, mock_logging, mock_parser):
+    def test_main_successful_command(self, main_env):
         """Should execute command and return 0."""
-        mock_args = MagicMock()
-        mock_args.command = "run"
-        mock_args.func.return_value = 0
-        mock_parser.return_value.parse_args.return_value = mock_args
+        main_env.args = SimpleNamespace(command="run", func=MagicMock(return_value=0))
 
         exit_code = main()
 
         assert exit_code == 0
-        mock_args.func.assert_called_once_with(mock_args)
+        main_env.args.func.assert_called_once_with(main_env.args)
 
-    @patch("tomorrow.__main__.create_parser")
-    @patch("tomorrow.__main__.configure_logging")
-    @patch("tomorrow.__main__.get_settings")
-    def test_main_failed_command(self, mock_settings, mock_logging, mock_parser):
+    def test_main_failed_command(self, main_env):
         """Should return non-zero on command failure."""
-        mock_args = MagicMock()
-        mock_args.command = "run"
-        mock_args.func.return_value = 1
-        mock_parser.return_value.parse_args.return_value = mock_args
+        main_env.args = SimpleNamespace(command="run", func=lambda args: 1)
 
         exit_code = main()
 
         assert exit_code == 1
 
-    @patch("tomorrow.__main__.create_parser")
-    @patch("tomorrow.__main__.configure_logging")
-    @patch("tomorrow.__main__.get_settings")
-    def test_main_exception(self, mock_settings, mock_logging, mock_parser):
+    def test_main_exception(self, main_env):
         """Should return 1 on exception."""
-        mock_args = MagicMock()
-        mock_args.command = "run"
-        mock_args.func.side_effect = Exception("Command error")
-        mock_parser.return_value.parse_args.return_value = mock_args
+        main_env.args = SimpleNamespace(
+            command="run", func=MagicMock(side_effect=Exception("Command error"))
+        )
 
         exit_code = main()
 
@@ -45,6 +45,26 @@ def reset_structlog():
     structlog.reset_defaults()
 
 
+# Processors and wrapper for captured logs; stateless, so built once and
+# reused by every test instead of re-instantiated per configure() call
+CAPTURE_PROCESSORS = (
+    structlog.processors.TimeStamper(fmt="iso"),
+    structlog.processors.add_log_level,
+    structlog.processors.JSONRenderer(),
+)
+CAPTURE_WRAPPER_CLASS = structlog.make_filtering_bound_logger(logging.INFO)
+
+
+def last_log_event(log_capture):
+    """Parse the last JSON log line in a capture buffer.
+
+    Scans back from the end for the final newline instead of splitting the
+    whole buffer into lines.
+    """
+    output = log_capture.getvalue().rstrip("\n")
+    return json.loads(output[output.rfind("\n") + 1 :])
+
+
 @pytest.fixture
 def capture_logs():
     """Capture log output for verification."""
@@ -52,13 +72,9 @@ def capture_logs():
 
     # Configure structlog to write to our capture (no extra logging_configured output)
     structlog.configure(
-        processors=[
-            structlog.processors.TimeStamper(fmt="iso"),
-            structlog.processors.add_log_level,
-            structlog.processors.JSONRenderer(),
-        ],
+        processors=CAPTURE_PROCESSORS,
         logger_factory=structlog.PrintLoggerFactory(file=log_capture),
-        wrapper_class=structlog.make_filtering_bound_logger(logging.INFO),
+        wrapper_class=CAPTURE_WRAPPER_CLASS,
     )
 
     yield log_capture
@@ -129,10 +145,8 @@ class TestGetLogger:
         logger = get_logger("my_module")
         logger.info("test_event")
 
-        log_output = capture_logs.getvalue()
-        # Get last line (the actual test event, not the configure_logging output)
-        last_line = log_output.strip().split("\n")[-1]
-        log_data = json.loads(last_line)
+        # Last line is the actual test event, not the configure_logging output
+        log_data = last_log_event(capture_logs)
 
         assert log_data["event"] == "test_event"
         assert log_data["logger_name"] == "my_module"
@@ -142,9 +156,7 @@ class TestGetLogger:
         logger = get_logger()
         logger.info("test_event")
 
-        log_output = capture_logs.getvalue()
-        last_line = log_output.strip().split("\n")[-1]
-        log_data = json.loads(last_line)
+        log_data = last_log_event(capture_logs)
 
         assert log_data["event"] == "test_event"
 
@@ -161,9 +173,7 @@ class TestLogMetric:
         """Should log metric with basic fields."""
         log_metric("pipeline_duration", 45.2, "seconds")
 
-        log_output = capture_logs.getvalue()
-        last_line = log_output.strip().split("\n")[-1]
-        log_data = json.loads(last_line)
+        log_data = last_log_event(capture_logs)
 
         assert log_data["event"] == "metric"
         assert log_data["metric_name"] == "pipeline_duration"
@@ -180,9 +190,7 @@ class TestLogMetric:
             endpoint="timelines",
         )
 
-        log_output = capture_logs.getvalue()
-        last_line = log_output.strip().split("\n")[-1]
-        log_data = json.loads(last_line)
+        log_data = last_log_event(capture_logs)
 
         assert log_data["metric_name"] == "api_requests"
         assert log_data["status"] == "success"
@@ -204,9 +212,7 @@ class TestPipelineEvents:
             granularity="hourly",
         )
 
-        log_output = capture_logs.getvalue()
-        last_line = log_output.strip().split("\n")[-1]
-        log_data = json.loads(last_line)
+        log_data = last_log_event(capture_logs)
 
         assert log_data["event"] == "pipeline_started"
         assert log_data["location_count"] == 10
@@ -221,9 +227,7 @@ class TestPipelineEvents:
             duration_seconds=45.234,
         )
 
-        log_output = capture_logs.getvalue()
-        last_line = log_output.strip().split("\n")[-1]
-        log_data = json.loads(last_line)
+        log_data = last_log_event(capture_logs)
 
         assert log_data["event"] == "pipeline_completed"
         assert log_data["locations_processed"] == 10
@@ -241,9 +245,7 @@ class TestPipelineEvents:
             duration_seconds=45.0,
         )
 
-        log_output = capture_logs.getvalue()
-        last_line = log_output.strip().split("\n")[-1]
-        log_data = json.loads(last_line)
+        log_data = last_log_event(capture_logs)
 
         assert log_data["success"] is False
 
@@ -266,9 +268,7 @@ class TestAPIRequestLogging:
             duration_ms=123.456,
         )
 
-        log_output = capture_logs.getvalue()
-        last_line = log_output.strip().split("\n")[-1]
-        log_data = json.loads(last_line)
+        log_data = last_log_event(capture_logs)
 
         assert log_data["event"] == "api_request"
         assert log_data["location_id"] == 1
@@ -295,9 +295,7 @@ class TestDBOperationLogging:
             duration_ms=50.123,
         )
 
-        log_output = capture_logs.getvalue()
-        last_line = log_output.strip().split("\n")[-1]
-        log_data = json.loads(last_line)
+        log_data = last_log_event(capture_logs)
 
         assert log_data["event"] == "db_operation"
         assert log_data["operation"] == "insert"
@@ -8,33 +8,15 @@ These tests verify:
 - Rollback works
 """
 
-import os
 from datetime import datetime, timezone
-from decimal import Decimal
 
 import pytest
-import psycopg2
 from psycopg2.extras import RealDictCursor
 from psycopg2 import errors as pg_errors
 
+from tomorrow.db import RECENT_DATA_CUTOFF
 
-def get_db_connection():
-    """Get a database connection using environment variables."""
-    return psycopg2.connect(
-        host=os.getenv("PGHOST", "localhost"),
-        port=os.getenv("PGPORT", "5432"),
-        database=os.getenv("PGDATABASE", "tomorrow"),
-        user=os.getenv("PGUSER", "postgres"),
-        password=os.getenv("PGPASSWORD", "postgres"),
-    )
-
-
-@pytest.fixture
-def db_conn():
-    """Provide a database connection for tests."""
-    conn = get_db_connection()
-    yield conn
-    conn.close()
+pytestmark = pytest.mark.db
 
 
 @pytest.fixture
@@ -43,6 +25,8 @@ def cursor(db_conn):
     cur = db_conn.cursor(cursor_factory=RealDictCursor)
     yield cur
     cur.close()
+    # Leave the shared connection clean for the next test
+    db_conn.rollback()
 
 
 @pytest.fixture
@@ -123,6 +107,21 @@ class TestWeatherDataTableStructure:
         assert "fetched_at" in columns
         assert "data_granularity" in columns
 
+    def test_weather_value_column_types(self, cursor):
+        """Measurements should be float4 and small codes int2."""
+        cursor.execute("""
+            SELECT column_name, data_type
+            FROM information_schema.columns
+            WHERE table_name = 'weather_data';
+        """)
+        types = {row["column_name"]: row["data_type"] for row in cursor.fetchall()}
+
+        assert types["temperature"] == "real"
+        assert types["pressure_sea_level"] == "real"
+        assert types["wind_direction"] == "smallint"
+        assert types["weather_code"] == "smallint"
+        assert types["uv_index"] == "smallint"
+
     def test_primary_key_constraint(self, cursor):
         """Should have composite primary key on (location_id, timestamp, data_granularity)."""
         cursor.execute("""
@@ -199,6 +198,45 @@ class TestIndexes:
         assert "data_granularity" in result["indexdef"]
         assert "timestamp" in result["indexdef"]
 
+    def test_latest_index_covers_summary_columns(self, cursor):
+        """Should include summary columns for index-only latest lookups."""
+        cursor.execute("""
+            SELECT indexdef
+            FROM pg_indexes
+            WHERE tablename = 'weather_data'
+                AND indexname = 'idx_weather_data_latest';
+        """)
+        result = cursor.fetchone()
+        assert result is not None
+        assert "INCLUDE (temperature, wind_speed, humidity)" in result["indexdef"]
+
+    def test_recent_partial_index_exists(self, cursor):
+        """Should have a partial index starting at RECENT_DATA_CUTOFF."""
+        # indexdef renders the cutoff in the session time zone
+        cursor.execute("SET LOCAL TimeZone = 'UTC';")
+        cursor.execute("""
+            SELECT indexdef
+            FROM pg_indexes
+            WHERE tablename = 'weather_data'
+                AND indexname = 'idx_weather_data_recent';
+        """)
+        result = cursor.fetchone()
+        assert result is not None
+        cutoff = RECENT_DATA_CUTOFF.strftime("%Y-%m-%d %H:%M:%S+00")
+        assert f"WHERE (\"timestamp\" >= '{cutoff}'" in result["indexdef"]
+
+    def test_timestamp_brin_index_exists(self, cursor):
+        """Should have a BRIN index for time-range scans."""
+        cursor.execute("""
+            SELECT indexdef
+            FROM pg_indexes
+            WHERE tablename = 'weather_data'
+                AND indexname = 'idx_weather_data_timestamp_brin';
+        """)
+        result = cursor.fetchone()
+        assert result is not None
+        assert "USING brin" in result["indexdef"]
+
     def test_fetched_at_index_exists(self, cursor):
         """Should have index for observability queries."""
         cursor.execute("""
@@ -290,8 +328,8 @@ class TestDataInsertion:
         )
         result = cursor.fetchone()
         assert result is not None
-        assert result["temperature"] == Decimal("25.50")
-        assert result["wind_speed"] == Decimal("5.20")
+        assert result["temperature"] == pytest.approx(25.5)
+        assert result["wind_speed"] == pytest.approx(5.2)
 
     def test_reject_invalid_granularity(self, db_conn, cursor, sample_location_id):
         """Should reject invalid data_granularity values."""
@@ -400,7 +438,7 @@ class TestDataInsertion:
             (sample_location_id, timestamp),
         )
         result = cursor.fetchone()
-        assert result["temperature"] == Decimal("30.00")
+        assert result["temperature"] == pytest.approx(30.0)
 
     def test_different_granularity_same_timestamp_allowed(
         self, db_conn, cursor, sample_location_id
@@ -473,7 +511,7 @@ class TestQueryPatterns:
         result = cursor.fetchone()
         assert result is not None
         # Latest timestamp is 12:00 with temperature 24.0
-        assert result["temperature"] == Decimal("24.00")
+        assert result["temperature"] == pytest.approx(24.0)
 
     def test_time_series_query(self, db_conn, cursor, sample_location_id):
         """Test query pattern: Hourly time series for selected location."""
@@ -508,9 +546,9 @@ class TestQueryPatterns:
         results = cursor.fetchall()
 
         assert len(results) == 3
-        assert results[0]["temperature"] == Decimal("21.00")
-        assert results[1]["temperature"] == Decimal("22.00")
-        assert results[2]["temperature"] == Decimal("23.00")
+        assert results[0]["temperature"] == pytest.approx(21.0)
+        assert results[1]["temperature"] == pytest.approx(22.0)
+        assert results[2]["temperature"] == pytest.approx(23.0)
 
 
 class TestDataTypes:
@@ -534,7 +572,7 @@ class TestDataTypes:
         )
         result = cursor.fetchone()
         db_conn.commit()
-        assert result["temperature"] == Decimal("-15.75")
+        assert result["temperature"] == pytest.approx(-15.75)
 
     def test_pressure_precision(self, db_conn, cursor, sample_location_id):
         """Pressure should support decimal precision."""
@@ -556,8 +594,8 @@ class TestDataTypes:
         )
         result = cursor.fetchone()
         db_conn.commit()
-        assert result["pressure_sea_level"] == Decimal("1015.55")
-        assert result["pressure_surface_level"] == Decimal("1013.22")
+        assert result["pressure_sea_level"] == pytest.approx(1015.55)
+        assert result["pressure_surface_level"] == pytest.approx(1013.22)
 
 
 class TestForeignKeyBehavior:
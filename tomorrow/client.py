@@ -1,6 +1,9 @@
 """Tomorrow.io API client."""
 
-from typing import Optional
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Dict, Optional, Tuple
 
 import requests
 from requests.adapters import HTTPAdapter
@@ -27,6 +30,41 @@ DEFAULT_FIELDS = [
     "pressureSurfaceLevel",
 ]
 
+# Seconds a successful response is reused for the same location, fields,
+# timesteps and hour of the requested range (0 disables the cache)
+RESPONSE_CACHE_TTL = 300
+RESPONSE_CACHE_MAXSIZE = 1024
+
+# Shared by all clients, since the ETL pipeline creates one client per run:
+# cache key -> (expires at (monotonic), raw response body). The body is
+# re-parsed on a hit, which gives each caller its own object and is several
+# times cheaper than deep-copying a parsed response
+_response_cache: Dict[tuple, Tuple[float, bytes]] = {}
+_response_cache_lock = threading.Lock()
+
+
+def _hour_bucket(timestamp: Optional[str]) -> Optional[str]:
+    """Truncate an ISO-8601 timestamp to the UTC hour, e.g. "2024-01-01T12".
+
+    Timestamps without an offset are taken as UTC, as the API does. Strings
+    that do not parse are returned unchanged so they still key the cache.
+    """
+    if not timestamp:
+        return None
+    try:
+        parsed = datetime.fromisoformat(timestamp)
+    except ValueError:
+        return timestamp
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed.astimezone(timezone.utc).strftime("%Y-%m-%dT%H")
+
+
+def clear_response_cache() -> None:
+    """Drop all cached API responses."""
+    with _response_cache_lock:
+        _response_cache.clear()
+
 
 class TomorrowAPIError(Exception):
     """Generic API error."""
@@ -43,9 +81,15 @@ class TomorrowAPIRateLimitError(TomorrowAPIError):
 class TomorrowClient:
     """Simple HTTP client for Tomorrow.io."""
 
-    def __init__(self, api_key: Optional[str] = None, timeout: int = DEFAULT_TIMEOUT):
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        timeout: int = DEFAULT_TIMEOUT,
+        cache_ttl: float = RESPONSE_CACHE_TTL,
+    ):
         self.api_key = api_key or get_settings().tomorrow_api_key
         self.timeout = timeout
+        self.cache_ttl = cache_ttl
         self.session = requests.Session()
 
         # Configure retries for transient server errors
@@ -60,10 +104,38 @@ class TomorrowClient:
         start_time: Optional[str] = None,
         end_time: Optional[str] = None,
     ) -> TimelinesResponse:
-        """Fetch weather data for a location."""
+        """Fetch weather data for a location.
+
+        Successful responses are cached for cache_ttl seconds, keyed on the
+        API key, location, fields, timesteps and the hour of
+        start_time/end_time, so repeated runs within the same hour skip the
+        request. A hit re-parses the cached body, so each caller gets its own
+        response object.
+        """
+        fields = fields or DEFAULT_FIELDS
+        cache_key = (
+            self.api_key,
+            location.lat,
+            location.lon,
+            tuple(fields),
+            timesteps,
+            _hour_bucket(start_time),
+            _hour_bucket(end_time),
+        )
+        if self.cache_ttl > 0:
+            with _response_cache_lock:
+                cached = _response_cache.get(cache_key)
+                if cached is not None and cached[0] <= time.monotonic():
+                    # Expired: drop it now rather than waiting for eviction
+                    _response_cache.pop(cache_key, None)
+                    cached = None
+            if cached is not None:
+                logger.debug("api_response_cache_hit", location_id=location.id)
+                return TimelinesResponse.model_validate_json(cached[1])
+
         params = {
             "location": f"{location.lat},{location.lon}",
-            "fields": ",".join(fields or DEFAULT_FIELDS),
+            "fields": ",".join(fields),
             "timesteps": timesteps,
             "units": "metric",
             "apikey": self.api_key,
@@ -84,16 +156,30 @@ class TomorrowClient:
 
             response.raise_for_status()
 
-            data = response.json()
-            return TimelinesResponse.model_validate(data)
+            # Parse and validate the raw bytes in one pass (pydantic-core's
+            # JSON parser) instead of building a dict with response.json()
+            result = TimelinesResponse.model_validate_json(response.content)
 
         except requests.RequestException as e:
             logger.error("api_request_failed", error=str(e))
             raise TomorrowAPIError(f"Request failed: {e}") from e
         except ValueError as e:
+            # Includes pydantic ValidationError for malformed JSON
             logger.error("response_parse_failed", error=str(e))
             raise TomorrowAPIError(f"Invalid response data: {e}") from e
 
+        if self.cache_ttl > 0:
+            with _response_cache_lock:
+                if len(_response_cache) >= RESPONSE_CACHE_MAXSIZE:
+                    # Evict the oldest entry (dicts keep insertion order)
+                    _response_cache.pop(next(iter(_response_cache)))
+                _response_cache[cache_key] = (
+                    time.monotonic() + self.cache_ttl,
+                    response.content,
+                )
+
+        return result
+
     def close(self):
         self.session.close()
 
@@ -4,8 +4,7 @@ Uses Pydantic Settings for environment variable-based configuration
 following 12-factor app principles.
 """
 
-from functools import lru_cache
-from typing import Literal
+from typing import Literal, Optional
 
 from pydantic import Field, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -180,17 +179,39 @@ class Settings(BaseSettings):
         return self.environment == "development"
 
 
-@lru_cache()
+# Global settings instance (loaded on first use)
+_settings: Optional[Settings] = None
+
+
 def get_settings() -> Settings:
     """Get cached settings instance.
 
-    Uses LRU cache to avoid re-parsing environment variables
-    on every call. Settings are loaded once at startup.
+    Settings are loaded once on first call and reused afterwards, avoiding
+    re-parsing environment variables and .env on every call.
 
     Returns:
         Settings instance with all configuration values
     """
-    return Settings()
+    global _settings
+
+    if _settings is None:
+        _settings = Settings()
+
+    return _settings
+
+
+def set_settings(settings: Optional[Settings]) -> None:
+    """Replace the cached settings instance.
+
+    Lets tests inject a ready-made Settings object instead of patching the
+    environment and reloading. Passing None makes the next get_settings()
+    call load from the environment again.
+
+    Args:
+        settings: Settings instance to use, or None to clear the cache
+    """
+    global _settings
+    _settings = settings
 
 
 def reload_settings() -> Settings:
@@ -202,5 +223,5 @@ def reload_settings() -> Settings:
     Returns:
         Fresh Settings instance
     """
-    get_settings.cache_clear()
+    set_settings(None)
     return get_settings()
@@ -4,14 +4,19 @@ Provides connection pooling, transaction management, and CRUD operations
 for locations and weather data.
 """
 
+import threading
+import time
 from contextlib import contextmanager
-from datetime import datetime
-from typing import List, Optional, Tuple
+from datetime import datetime, timezone
+from itertools import islice
+from operator import attrgetter
+from typing import List, Optional, Set, Tuple, Type, TypeVar
 
 import psycopg2
+from pydantic import BaseModel
 
-from psycopg2.extras import RealDictCursor, execute_values
-from psycopg2.pool import SimpleConnectionPool
+from psycopg2.extras import RealDictCursor
+from psycopg2.pool import ThreadedConnectionPool
 
 from tomorrow.config import get_settings
 from tomorrow.models import Location, LocationSummary, WeatherReading
@@ -19,51 +24,181 @@ from tomorrow.observability import get_logger
 
 logger = get_logger(__name__)
 
+M = TypeVar("M", bound=BaseModel)
+
+# NUMERIC/DECIMAL columns as float, matching the model field types, so rows
+# from our own queries can be turned into models without re-validation
+DECIMAL_AS_FLOAT = psycopg2.extensions.new_type(
+    psycopg2.extensions.DECIMAL.values,
+    "DECIMAL_AS_FLOAT",
+    lambda value, cur: float(value) if value is not None else None,
+)
+
+# Plain tuple rows for the hot readers that build models (see _fetch_models)
+TUPLE_CURSOR = psycopg2.extensions.cursor
+
 # Global connection pool (initialized on first use)
-_connection_pool: Optional[SimpleConnectionPool] = None
+_connection_pool: Optional[ThreadedConnectionPool] = None
+_pool_lock = threading.Lock()
+
+# Lower bound of the partial index idx_weather_data_recent (migration 006).
+# Queries must repeat it as a literal for the planner to use that index.
+RECENT_DATA_CUTOFF = datetime(2026, 10, 1, tzinfo=timezone.utc)
+_RECENT_DATA_PREDICATE = "AND timestamp >= '2026-10-01 00:00:00+00'"
+
+_TIME_SERIES_QUERY = """
+    SELECT
+        location_id,
+        timestamp,
+        temperature,
+        temperature_apparent,
+        wind_speed,
+        wind_gust,
+        wind_direction,
+        humidity,
+        precipitation_probability,
+        weather_code,
+        cloud_cover,
+        visibility,
+        pressure_sea_level,
+        pressure_surface_level,
+        dew_point,
+        uv_index,
+        data_granularity
+    FROM weather_data
+    WHERE location_id = $1
+      AND data_granularity = $2
+      AND timestamp BETWEEN $3 AND $4
+      {recent_predicate}
+    ORDER BY timestamp ASC
+"""
+
+# Hot lookups, PREPAREd once per connection so the server skips parse/plan
+# on every call: name -> (parameter types, statement)
+_PREPARED_STATEMENTS = {
+    "location_by_id": (
+        "integer",
+        "SELECT id, lat, lon, name, is_active, created_at FROM locations WHERE id = $1",
+    ),
+    "location_by_coordinates": (
+        "numeric, numeric",
+        "SELECT id, lat, lon, name, is_active, created_at "
+        "FROM locations WHERE lat = $1 AND lon = $2",
+    ),
+    "latest_by_location": (
+        "text",
+        """
+        SELECT
+            l.id as location_id,
+            l.lat,
+            l.lon,
+            l.name,
+            w.timestamp,
+            w.temperature,
+            w.wind_speed,
+            w.humidity
+        FROM locations l
+        CROSS JOIN LATERAL (
+            SELECT timestamp, temperature, wind_speed, humidity
+            FROM weather_data
+            WHERE location_id = l.id
+              AND data_granularity = $1
+            ORDER BY timestamp DESC
+            LIMIT 1
+        ) w
+        WHERE l.is_active = TRUE
+        ORDER BY l.id
+        """,
+    ),
+    "time_series": (
+        "integer, text, timestamptz, timestamptz",
+        _TIME_SERIES_QUERY.format(recent_predicate=""),
+    ),
+    # Same query with the partial index predicate spelled out
+    "time_series_recent": (
+        "integer, text, timestamptz, timestamptz",
+        _TIME_SERIES_QUERY.format(recent_predicate=_RECENT_DATA_PREDICATE),
+    ),
+    "data_availability": (
+        "integer, text",
+        """
+        SELECT
+            MIN(timestamp) as earliest,
+            MAX(timestamp) as latest
+        FROM weather_data
+        WHERE location_id = $1
+          AND data_granularity = $2
+        """,
+    ),
+}
+
+
+class PreparingConnection(psycopg2.extensions.connection):
+    """Connection that remembers which statements it has prepared.
+
+    Prepared statements live for the whole server session, so tracking
+    them on the connection object lets pooled connections reuse them.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.prepared: Set[str] = set()
+        psycopg2.extensions.register_type(DECIMAL_AS_FLOAT, self)
+
+
+def _create_pool() -> ThreadedConnectionPool:
+    """Create the connection pool from settings."""
+    settings = get_settings()
+    try:
+        pool = ThreadedConnectionPool(
+            minconn=1,
+            maxconn=settings.pg_pool_size,
+            host=settings.pg_host,
+            port=settings.pg_port,
+            database=settings.pg_database,
+            user=settings.pg_user,
+            password=settings.pg_password,
+            connect_timeout=settings.pg_pool_timeout_seconds,
+            connection_factory=PreparingConnection,
+            # Return dictionaries instead of tuples
+            cursor_factory=RealDictCursor,
+        )
+    except psycopg2.Error as e:
+        logger.error(
+            "database_pool_creation_failed",
+            host=settings.pg_host,
+            port=settings.pg_port,
+            error=str(e),
+        )
+        raise
 
+    logger.info(
+        "database_pool_created",
+        host=settings.pg_host,
+        port=settings.pg_port,
+        database=settings.pg_database,
+        pool_size=settings.pg_pool_size,
+    )
+    return pool
 
-def get_connection_pool() -> SimpleConnectionPool:
+
+def get_connection_pool() -> ThreadedConnectionPool:
     """Get or create the database connection pool.
 
     Uses a singleton pattern to ensure only one pool exists.
-    The pool is thread-safe and handles concurrent requests.
+    The pool is thread-safe, so scheduler jobs running in worker threads
+    can check connections in and out concurrently.
 
     Returns:
-        SimpleConnectionPool instance
+        ThreadedConnectionPool instance
     """
     global _connection_pool
 
     if _connection_pool is None:
-        settings = get_settings()
-        try:
-            _connection_pool = SimpleConnectionPool(
-                minconn=1,
-                maxconn=settings.pg_pool_size,
-                host=settings.pg_host,
-                port=settings.pg_port,
-                database=settings.pg_database,
-                user=settings.pg_user,
-                password=settings.pg_password,
-                connect_timeout=settings.pg_pool_timeout_seconds,
-                # Return dictionaries instead of tuples
-                cursor_factory=RealDictCursor,
-            )
-            logger.info(
-                "database_pool_created",
-                host=settings.pg_host,
-                port=settings.pg_port,
-                database=settings.pg_database,
-                pool_size=settings.pg_pool_size,
-            )
-        except psycopg2.Error as e:
-            logger.error(
-                "database_pool_creation_failed",
-                host=settings.pg_host,
-                port=settings.pg_port,
-                error=str(e),
-            )
-            raise
+        with _pool_lock:
+            # Another thread may have created it while we waited
+            if _connection_pool is None:
+                _connection_pool = _create_pool()
 
     return _connection_pool
 
@@ -99,13 +234,17 @@ def get_connection():
 
 
 @contextmanager
-def get_cursor():
+def get_cursor(cursor_factory=None):
     """Context manager for database cursors.
 
     Combines get_connection() with cursor creation for convenience.
 
+    Args:
+        cursor_factory: Cursor class to use instead of the pool's
+            RealDictCursor, e.g. TUPLE_CURSOR for hot readers
+
     Yields:
-        Database cursor object with RealDictCursor factory
+        Database cursor object (RealDictCursor unless overridden)
 
     Example:
         with get_cursor() as cur:
@@ -113,7 +252,7 @@ def get_cursor():
             results = cur.fetchall()
     """
     with get_connection() as conn:
-        with conn.cursor() as cur:
+        with conn.cursor(cursor_factory=cursor_factory) as cur:
             yield cur
 
 
@@ -129,16 +268,68 @@ def close_all_connections() -> None:
         logger.info("database_pool_closed")
 
 
+def _execute_prepared(cur, name: str, params: Tuple) -> None:
+    """Execute a statement from _PREPARED_STATEMENTS, preparing it if needed.
+
+    Args:
+        cur: Cursor on a PreparingConnection
+        name: Key into _PREPARED_STATEMENTS
+        params: Parameter values, in $1, $2... order
+    """
+    prepared = cur.connection.prepared
+    if name not in prepared:
+        types, statement = _PREPARED_STATEMENTS[name]
+        cur.execute(f"PREPARE {name}({types}) AS {statement}")
+        prepared.add(name)
+
+    placeholders = ", ".join(["%s"] * len(params))
+    cur.execute(f"EXECUTE {name}({placeholders})", params)
+
+
+def _fetch_models(cur, model: Type[M]) -> List[M]:
+    """Build models from the remaining rows without re-validating them.
+
+    Only for rows produced by this module's own queries, whose columns and
+    types already match the model (see DECIMAL_AS_FLOAT).
+
+    Args:
+        cur: TUPLE_CURSOR with a pending result set
+        model: Pydantic model class whose fields match the selected columns
+
+    Returns:
+        List of model instances
+    """
+    names = [column.name for column in cur.description]
+    construct = model.model_construct
+    # Plain tuples zipped with the column names once: RealDictCursor would
+    # build each row dict key by key in Python
+    return [construct(**dict(zip(names, row))) for row in cur.fetchall()]
+
+
 # =============================================================================
 # Location Operations
 # =============================================================================
 
 
+# Locations change on migration/admin timescales, not per ETL run, so the
+# active list is reused for LOCATIONS_CACHE_TTL seconds:
+# (expires at (monotonic), locations)
+LOCATIONS_CACHE_TTL = 60
+_active_locations_cache: Optional[Tuple[float, List[Location]]] = None
+
+
+def clear_locations_cache() -> None:
+    """Forget cached active locations; call after modifying locations."""
+    global _active_locations_cache
+    _active_locations_cache = None
+
+
 def get_active_locations() -> List[Location]:
     """Fetch all active locations from the database.
 
     Returns locations that are marked as active for data collection.
-    Locations are ordered by ID for consistent results.
+    Locations are ordered by ID for consistent results. Results are cached
+    for LOCATIONS_CACHE_TTL seconds (see clear_locations_cache()).
 
     Returns:
         List of Location objects
@@ -146,7 +337,13 @@ def get_active_locations() -> List[Location]:
     Raises:
         psycopg2.Error: If database query fails
     """
-    with get_cursor() as cur:
+    global _active_locations_cache
+
+    cached = _active_locations_cache
+    if cached is not None and cached[0] > time.monotonic():
+        return list(cached[1])
+
+    with get_cursor(TUPLE_CURSOR) as cur:
         cur.execute(
             """
             SELECT id, lat, lon, name, is_active, created_at
@@ -155,13 +352,12 @@ def get_active_locations() -> List[Location]:
             ORDER BY id
             """
         )
-        rows = cur.fetchall()
-
-        locations = [Location.model_validate(dict(row)) for row in rows]
+        locations = _fetch_models(cur, Location)
 
         logger.info("locations_fetched", count=len(locations))
+        _active_locations_cache = (time.monotonic() + LOCATIONS_CACHE_TTL, locations)
 
-        return locations
+        return list(locations)
 
 
 def get_location_by_id(location_id: int) -> Optional[Location]:
@@ -173,20 +369,11 @@ def get_location_by_id(location_id: int) -> Optional[Location]:
     Returns:
         Location object if found, None otherwise
     """
-    with get_cursor() as cur:
-        cur.execute(
-            """
-            SELECT id, lat, lon, name, is_active, created_at
-            FROM locations
-            WHERE id = %s
-            """,
-            (location_id,),
-        )
-        row = cur.fetchone()
+    with get_cursor(TUPLE_CURSOR) as cur:
+        _execute_prepared(cur, "location_by_id", (location_id,))
+        locations = _fetch_models(cur, Location)
 
-        if row:
-            return Location.model_validate(dict(row))
-        return None
+        return locations[0] if locations else None
 
 
 def get_location_by_coordinates(lat: float, lon: float) -> Optional[Location]:
@@ -199,32 +386,52 @@ def get_location_by_coordinates(lat: float, lon: float) -> Optional[Location]:
     Returns:
         Location object if found, None otherwise
     """
-    with get_cursor() as cur:
-        cur.execute(
-            """
-            SELECT id, lat, lon, name, is_active, created_at
-            FROM locations
-            WHERE lat = %s AND lon = %s
-            """,
-            (lat, lon),
-        )
-        row = cur.fetchone()
+    with get_cursor(TUPLE_CURSOR) as cur:
+        _execute_prepared(cur, "location_by_coordinates", (lat, lon))
+        locations = _fetch_models(cur, Location)
 
-        if row:
-            return Location.model_validate(dict(row))
-        return None
+        return locations[0] if locations else None
 
 
 # =============================================================================
 # Weather Data Operations
 # =============================================================================
 
+# Column order must match the weather_reading_row type (migration 007)
+READING_COLUMNS = (
+    "location_id",
+    "timestamp",
+    "temperature",
+    "temperature_apparent",
+    "wind_speed",
+    "wind_gust",
+    "wind_direction",
+    "humidity",
+    "precipitation_probability",
+    "weather_code",
+    "cloud_cover",
+    "visibility",
+    "pressure_sea_level",
+    "pressure_surface_level",
+    "dew_point",
+    "uv_index",
+    "data_granularity",
+)
+_reading_row = attrgetter(*READING_COLUMNS)
+
+# Column values sent per upsert_weather call. psycopg2 interpolates the
+# batch into the statement text client-side, so this bounds the size of
+# each statement (a few hundred KB) rather than a bind-parameter count
+MAX_BATCH_VALUES = 30000
+INSERT_PAGE_SIZE = max(1, MAX_BATCH_VALUES // len(READING_COLUMNS))
+
 
 def insert_readings(readings: List[WeatherReading]) -> int:
     """Insert weather readings into the database.
 
     Uses UPSERT (ON CONFLICT DO UPDATE) to handle duplicate entries.
-    This makes the operation idempotent - safe to re-run.
+    This makes the operation idempotent - safe to re-run. Any number of
+    readings can be passed; they are sent in pages of INSERT_PAGE_SIZE.
 
     Args:
         readings: List of WeatherReading objects to insert
@@ -239,65 +446,21 @@ def insert_readings(readings: List[WeatherReading]) -> int:
         logger.info("insert_readings_empty_list")
         return 0
 
-    # Prepare data for bulk insert
-    # Column order must match the INSERT statement
-    data = [
-        (
-            r.location_id,
-            r.timestamp,
-            r.temperature,
-            r.temperature_apparent,
-            r.wind_speed,
-            r.wind_gust,
-            r.wind_direction,
-            r.humidity,
-            r.precipitation_probability,
-            r.weather_code,
-            r.cloud_cover,
-            r.visibility,
-            r.pressure_sea_level,
-            r.pressure_surface_level,
-            r.dew_point,
-            r.uv_index,
-            r.data_granularity,
-        )
-        for r in readings
-    ]
+    # Row tuples are built lazily (attrgetter, in C) one page at a time
+    rows = map(_reading_row, readings)
+    rowcount = 0
 
     with get_cursor() as cur:
-        # Use execute_values for efficient bulk insert
-        execute_values(
-            cur,
-            """
-            INSERT INTO weather_data (
-                location_id, timestamp, temperature, temperature_apparent,
-                wind_speed, wind_gust, wind_direction, humidity,
-                precipitation_probability, weather_code, cloud_cover,
-                visibility, pressure_sea_level, pressure_surface_level,
-                dew_point, uv_index, data_granularity
-            ) VALUES %s
-            ON CONFLICT (location_id, timestamp, data_granularity) DO UPDATE SET
-                temperature = EXCLUDED.temperature,
-                temperature_apparent = EXCLUDED.temperature_apparent,
-                wind_speed = EXCLUDED.wind_speed,
-                wind_gust = EXCLUDED.wind_gust,
-                wind_direction = EXCLUDED.wind_direction,
-                humidity = EXCLUDED.humidity,
-                precipitation_probability = EXCLUDED.precipitation_probability,
-                weather_code = EXCLUDED.weather_code,
-                cloud_cover = EXCLUDED.cloud_cover,
-                visibility = EXCLUDED.visibility,
-                pressure_sea_level = EXCLUDED.pressure_sea_level,
-                pressure_surface_level = EXCLUDED.pressure_surface_level,
-                dew_point = EXCLUDED.dew_point,
-                uv_index = EXCLUDED.uv_index,
-                fetched_at = NOW()
-            """,
-            data,
-            page_size=1000,  # Process in batches for large inserts
-        )
-
-        rowcount = cur.rowcount
+        # upsert_weather (migration 007) runs the INSERT ... ON CONFLICT
+        # server-side from a single array argument, so its plan is cached
+        # for the session instead of re-parsed for every batch.
+        # COPY is not used - it cannot express the ON CONFLICT upsert.
+        while page := list(islice(rows, INSERT_PAGE_SIZE)):
+            cur.execute(
+                "SELECT upsert_weather(%s::weather_reading_row[]) AS affected",
+                (page,),
+            )
+            rowcount += cur.fetchone()["affected"]
 
         logger.info(
             "readings_inserted",
@@ -314,35 +477,21 @@ def get_latest_by_location(granularity: str = "hourly") -> List[LocationSummary]
     This answers the assignment question:
     "What's the latest temperature for each geolocation? What's the latest wind speed?"
 
+    Reads live from weather_data rather than a materialized view: with one
+    covering index seek per active location the query is already cheap,
+    and results are never stale after insert_readings().
+
     Args:
         granularity: Data granularity (minutely, hourly, daily)
 
     Returns:
         List of LocationSummary objects with latest readings
     """
-    with get_cursor() as cur:
-        cur.execute(
-            """
-            SELECT DISTINCT ON (l.id)
-                l.id as location_id,
-                l.lat,
-                l.lon,
-                l.name,
-                w.timestamp,
-                w.temperature,
-                w.wind_speed,
-                w.humidity
-            FROM locations l
-            JOIN weather_data w ON w.location_id = l.id
-            WHERE w.data_granularity = %s
-              AND l.is_active = TRUE
-            ORDER BY l.id, w.timestamp DESC
-            """,
-            (granularity,),
-        )
-        rows = cur.fetchall()
-
-        summaries = [LocationSummary.model_validate(dict(row)) for row in rows]
+    with get_cursor(TUPLE_CURSOR) as cur:
+        # One LIMIT 1 index seek per location on idx_weather_data_latest
+        # instead of DISTINCT ON sorting every reading of every location
+        _execute_prepared(cur, "latest_by_location", (granularity,))
+        summaries = _fetch_models(cur, LocationSummary)
 
         logger.info(
             "latest_readings_fetched",
@@ -373,38 +522,19 @@ def get_time_series(
     Returns:
         List of WeatherReading objects ordered by timestamp
     """
-    with get_cursor() as cur:
-        cur.execute(
-            """
-            SELECT
-                location_id,
-                timestamp,
-                temperature,
-                temperature_apparent,
-                wind_speed,
-                wind_gust,
-                wind_direction,
-                humidity,
-                precipitation_probability,
-                weather_code,
-                cloud_cover,
-                visibility,
-                pressure_sea_level,
-                pressure_surface_level,
-                dew_point,
-                uv_index,
-                data_granularity
-            FROM weather_data
-            WHERE location_id = %s
-              AND data_granularity = %s
-              AND timestamp BETWEEN %s AND %s
-            ORDER BY timestamp ASC
-            """,
-            (location_id, granularity, start_time, end_time),
+    # Ranges inside the recent window can use the smaller partial index
+    range_start = (
+        start_time if start_time.tzinfo else start_time.replace(tzinfo=timezone.utc)
+    )
+    statement = (
+        "time_series_recent" if range_start >= RECENT_DATA_CUTOFF else "time_series"
+    )
+
+    with get_cursor(TUPLE_CURSOR) as cur:
+        _execute_prepared(
+            cur, statement, (location_id, granularity, start_time, end_time)
         )
-        rows = cur.fetchall()
-
-        readings = [WeatherReading.model_validate(dict(row)) for row in rows]
+        readings = _fetch_models(cur, WeatherReading)
 
         logger.info(
             "time_series_fetched",
@@ -431,17 +561,7 @@ def get_data_availability(
         Tuple of (earliest_timestamp, latest_timestamp) or (None, None) if no data
     """
     with get_cursor() as cur:
-        cur.execute(
-            """
-            SELECT
-                MIN(timestamp) as earliest,
-                MAX(timestamp) as latest
-            FROM weather_data
-            WHERE location_id = %s
-              AND data_granularity = %s
-            """,
-            (location_id, granularity),
-        )
+        _execute_prepared(cur, "data_availability", (location_id, granularity))
         row = cur.fetchone()
 
         if row and row["earliest"]:
@@ -14,17 +14,27 @@ Features:
 
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
+from operator import attrgetter
 import time
 from typing import List, Optional
 
 from tomorrow.client import TomorrowClient, TomorrowAPIError, TomorrowAPIRateLimitError
 from tomorrow.db import get_active_locations, insert_readings, get_latest_by_location
-from tomorrow.models import Location, WeatherReading, TimelinesResponse
+from tomorrow.models import Location, WeatherReading, TimelinesResponse, TimelineValues
 from tomorrow.observability import get_logger
 
 
 logger = get_logger(__name__)
 
+# WeatherReading fields copied straight from the API's TimelineValues
+_READING_VALUE_FIELDS = tuple(
+    name for name in WeatherReading.model_fields if name in TimelineValues.model_fields
+)
+_reading_values = attrgetter(*_READING_VALUE_FIELDS)
+
+# Minimum time between the starts of consecutive API requests
+REQUEST_INTERVAL_SECONDS = 3.0
+
 
 @dataclass
 class ETLResult:
@@ -73,58 +83,35 @@ def transform_timeline_to_readings(
 
     Returns:
         List of WeatherReading models ready for database insertion
-    """
-    readings = []
 
+    Raises:
+        ValueError: If granularity is not minutely, hourly or daily
+    """
     # Map granularity to timestep format used by API
     timestep_map = {
         "minutely": "1m",
         "hourly": "1h",
         "daily": "1d",
     }
-    target_timestep = timestep_map.get(granularity, "1h")
+    if granularity not in timestep_map:
+        raise ValueError(f"Unsupported granularity: {granularity}")
+    target_timestep = timestep_map[granularity]
+
+    readings = []
 
     # Find the timeline matching our requested granularity
     for timeline in response.data.timelines:
         if timeline.timestep == target_timestep:
             for interval in timeline.intervals:
-                values = interval.values
-
-                reading = WeatherReading(
+                # Values were already validated when the response was parsed,
+                # so build the reading without a second validation pass
+                reading = WeatherReading.model_construct(
                     location_id=location.id,
                     timestamp=interval.start_time,
-                    temperature=values.temperature,
-                    temperature_apparent=values.temperature_apparent,
-                    wind_speed=values.wind_speed,
-                    wind_gust=values.wind_gust,
-                    wind_direction=values.wind_direction,
-                    humidity=values.humidity,
-                    dew_point=values.dew_point,
-                    cloud_cover=values.cloud_cover,
-                    cloud_base=values.cloud_base,
-                    cloud_ceiling=values.cloud_ceiling,
-                    visibility=values.visibility,
-                    precipitation_probability=values.precipitation_probability,
-                    rain_intensity=values.rain_intensity,
-                    rain_accumulation=values.rain_accumulation,
-                    freezing_rain_intensity=values.freezing_rain_intensity,
-                    sleet_intensity=values.sleet_intensity,
-                    sleet_accumulation=values.sleet_accumulation,
-                    sleet_accumulation_lwe=values.sleet_accumulation_lwe,
-                    snow_intensity=values.snow_intensity,
-                    snow_accumulation=values.snow_accumulation,
-                    snow_accumulation_lwe=values.snow_accumulation_lwe,
-                    snow_depth=values.snow_depth,
-                    ice_accumulation=values.ice_accumulation,
-                    ice_accumulation_lwe=values.ice_accumulation_lwe,
-                    evapotranspiration=values.evapotranspiration,
-                    pressure_sea_level=values.pressure_sea_level,
-                    pressure_surface_level=values.pressure_surface_level,
-                    altimeter_setting=values.altimeter_setting,
-                    weather_code=values.weather_code,
-                    uv_index=values.uv_index,
-                    uv_health_concern=values.uv_health_concern,
                     data_granularity=granularity,
+                    **dict(
+                        zip(_READING_VALUE_FIELDS, _reading_values(interval.values))
+                    ),
                 )
                 readings.append(reading)
 
@@ -240,11 +227,17 @@ def run_etl_pipeline(
         all_readings: List[WeatherReading] = []
         rate_limited = False
 
-        for i, location in enumerate(locations):
-            # Add delay between requests to avoid rate limiting (skip first request)
-            if i > 0:
-                logger.debug("rate_limit_delay", seconds=3)
-                time.sleep(3)
+        last_request_at: Optional[float] = None
+
+        for location in locations:
+            # Space request starts to avoid rate limiting; time already spent
+            # fetching and transforming the previous location counts towards it
+            if last_request_at is not None:
+                delay = REQUEST_INTERVAL_SECONDS - (time.monotonic() - last_request_at)
+                if delay > 0:
+                    logger.debug("rate_limit_delay", seconds=round(delay, 2))
+                    time.sleep(delay)
+            last_request_at = time.monotonic()
 
             try:
                 logger.debug(
@@ -318,6 +311,9 @@ def run_etl_pipeline(
         # LOAD: Insert readings into database
         # ======================================================================
 
+        # Readings from every location go out in one insert_readings() call,
+        # i.e. one round-trip per INSERT_PAGE_SIZE readings rather than one
+        # (or more) per location - keep it that way when changing this loop
         if all_readings:
             try:
                 logger.info("inserting_readings", count=len(all_readings))
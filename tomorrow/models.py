@@ -253,10 +253,11 @@ class WeatherReading(BaseModel):
     """Internal model representing a single weather reading.
 
     Maps directly to the weather_data database table.
-    Used for inserting data into the database.
+    Used for inserting data into the database. Immutable - use
+    model_copy(update=...) to derive a changed reading.
     """
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
     location_id: int = Field(..., description="Foreign key to locations table")
     timestamp: datetime = Field(..., description="Timestamp of the weather reading")